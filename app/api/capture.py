@@ -1,12 +1,17 @@
+import asyncio
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.dependencies import get_git_service, get_inbox_service, get_vault_service, verify_token
+from app.dependencies import (
+    get_git_commit_debouncer,
+    get_inbox_service,
+    get_vault_service,
+    verify_token,
+)
 from app.exceptions import InboxError, VaultError
 from app.models.capture import CaptureRequest, CaptureResponse
-from app.services.background_tasks import safe_background_task
-from app.services.git import GitService
+from app.services.git_debouncer import GitCommitDebouncer
 from app.services.inbox import InboxService
 from app.services.vault import VaultService
 from app.utils.error_handling import format_exception_for_response
@@ -18,9 +23,8 @@ router = APIRouter(prefix="/api/v1")
 @router.post("/capture", response_model=CaptureResponse)
 async def capture(
     request: CaptureRequest,
-    background_tasks: BackgroundTasks,
     vault_service: VaultService = Depends(get_vault_service),
-    git_service: GitService = Depends(get_git_service),
+    git_commit_debouncer: GitCommitDebouncer = Depends(get_git_commit_debouncer),
     inbox_service: InboxService = Depends(get_inbox_service),
     _: None = Depends(verify_token),
 ) -> CaptureResponse:
@@ -32,7 +36,7 @@ async def capture(
     2. Determine inbox file path based on vault config
     3. Write capture file with frontmatter (creates directories as needed)
     4. Return response immediately
-    5. Commit and push to git in background (errors ignored)
+    5. Schedule a coalesced git commit and push (errors ignored)
 
     Note: Any downstream processing is triggered separately (for example via the
     commands trigger endpoint) to keep capture fast and non-blocking.
@@ -52,14 +56,15 @@ async def capture(
 
     try:
         # Write capture to its own file with frontmatter
-        content = inbox_service.format_capture_file(request, dump_id)
-        inbox_service.write_capture(inbox_file, content)
+        parts = inbox_service.format_capture_parts(request, dump_id)
+        # File I/O runs in a worker thread so the event loop keeps serving requests
+        await asyncio.to_thread(inbox_service.write_capture_parts, inbox_file, parts)
         logger.info(
             "Capture saved locally",
             extra={
                 "dump_id": dump_id,
                 "relative_path": relative_path,
-                "size_bytes": len(content),
+                "size_bytes": sum(len(part) for part in parts),
             },
         )
     except (OSError, InboxError, VaultError) as e:
@@ -94,12 +99,8 @@ async def capture(
             },
         ) from e
 
-    # Queue git commit and push in background with error tracking
-    background_tasks.add_task(
-        safe_background_task,
-        "git_auto_commit",
-        git_service.auto_commit_and_push,
-    )
+    # Captures arriving within the debounce window share one commit and push
+    git_commit_debouncer.mark_dirty()
 
     return CaptureResponse(
         ok=True,
@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+import secrets
+from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, WebSocket, status
 from fastapi.websockets import WebSocketDisconnect
 
@@ -12,7 +14,6 @@ from app.dependencies import get_agent_session_manager, get_chat_session_manager
 from app.models.chat import (
     AskUserResponseData,
     ChatHistoryResponse,
-    ChatMessage,
     ChatSessionResponse,
     WSInputMessage,
     WSMessageType,
@@ -23,6 +24,19 @@ from app.utils.path_validation import PathValidationError, validate_session_id
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/chat", tags=["chat"])
 
+# Maximum buffered events packed into one replay_batch frame
+REPLAY_BATCH_SIZE = 256
+
+
+async def _send_json(websocket: WebSocket, payload: Any) -> None:
+    """Send a JSON text frame encoded with orjson (faster than starlette's json.dumps)."""
+    await websocket.send_text(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode())
+
+
+async def _receive_json(websocket: WebSocket) -> Any:
+    """Receive a JSON text frame decoded with orjson."""
+    return orjson.loads(await websocket.receive_text())
+
 
 class ConnectionManager:
     """
@@ -30,12 +44,19 @@ class ConnectionManager:
 
     Session lifecycle is now handled by AgentSessionManager.
     This class only manages WebSocket connections.
+
+    The only shared state is the connection dict, and single dict operations
+    are atomic on the event loop, so connect/disconnect are lock-free: a slow
+    handshake never holds up other connections.
     """
 
+    # A client that cannot drain one event in this time is treated as dead
+    SEND_TIMEOUT_SECONDS = 10.0
+
     def __init__(self) -> None:
         """Initialize connection manager."""
         self.active_connections: dict[str, WebSocket] = {}
-        self._lock = asyncio.Lock()
+        self._close_tasks: set[asyncio.Task[None]] = set()
 
     async def connect(self, connection_id: str, websocket: WebSocket) -> bool:
         """
@@ -48,17 +69,22 @@ class ConnectionManager:
         Returns:
             True if connected successfully, False if already connected
         """
-        async with self._lock:
-            if connection_id in self.active_connections:
-                await websocket.close(code=1008, reason="Connection already active")
-                logger.warning("Rejected duplicate connection %s", connection_id)
-                return False
+        # Claim the ID before the first await so a concurrent connect with the
+        # same ID sees it taken while this handshake is still in progress
+        if self.active_connections.setdefault(connection_id, websocket) is not websocket:
+            await websocket.close(code=1008, reason="Connection already active")
+            logger.warning("Rejected duplicate connection %s", connection_id)
+            return False
 
+        try:
             await websocket.accept()
-            self.active_connections[connection_id] = websocket
+        except BaseException:
+            if self.active_connections.get(connection_id) is websocket:
+                del self.active_connections[connection_id]
+            raise
 
-            logger.info("WebSocket connected (connection=%s)", connection_id)
-            return True
+        logger.info("WebSocket connected (connection=%s)", connection_id)
+        return True
 
     async def disconnect(
         self,
@@ -73,12 +99,22 @@ class ConnectionManager:
         Args:
             connection_id: Connection identifier
         """
-        async with self._lock:
-            websocket = self.active_connections.pop(connection_id, None)
+        websocket = self.active_connections.pop(connection_id, None)
 
         if not websocket:
             return
 
+        await self._close_websocket(connection_id, websocket, code=code, reason=reason)
+
+    async def _close_websocket(
+        self,
+        connection_id: str,
+        websocket: WebSocket,
+        *,
+        code: int = 1000,
+        reason: str | None = None,
+    ) -> None:
+        """Close an already-removed WebSocket, ignoring transport errors."""
         try:
             await websocket.close(code=code, reason=reason or "")
         except Exception as e:
@@ -97,18 +133,39 @@ class ConnectionManager:
         Returns:
             True if sent successfully, False if connection doesn't exist
         """
-        async with self._lock:
-            websocket = self.active_connections.get(connection_id)
+        # No await between lookup and use, so this read needs no lock
+        websocket = self.active_connections.get(connection_id)
         if not websocket:
             return False
 
+        close_code = 1000
         try:
-            await websocket.send_json(message)
+            # asyncio.timeout wraps the current task instead of spawning one
+            # per event like wait_for does
+            async with asyncio.timeout(self.SEND_TIMEOUT_SECONDS):
+                await _send_json(websocket, message)
             return True
+        except TimeoutError:
+            logger.warning(
+                "Send to connection %s timed out after %.1fs, closing slow client",
+                connection_id,
+                self.SEND_TIMEOUT_SECONDS,
+            )
+            close_code = 1013  # Try again later
         except Exception as e:
             logger.error("Error sending to connection %s: %s", connection_id, e)
-            await self.disconnect(connection_id)
-            return False
+
+        # Drop the dead connection without taking a lock and close it in the
+        # background, so a failing client never delays the caller. The caller
+        # buffers the undelivered event (bounded) for replay on reconnect.
+        if self.active_connections.get(connection_id) is websocket:
+            del self.active_connections[connection_id]
+            task = asyncio.create_task(
+                self._close_websocket(connection_id, websocket, code=close_code)
+            )
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+        return False
 
 
 # Module-level connection manager
@@ -132,9 +189,7 @@ async def create_session(
     Returns:
         Session metadata with connection_id
     """
-    from datetime import UTC, datetime
-
-    connection_id = f"conn_{uuid4().hex[:16]}"
+    connection_id = f"conn_{secrets.token_hex(8)}"
 
     return ChatSessionResponse(
         session_id=connection_id,
@@ -149,7 +204,7 @@ async def create_session(
 async def get_session_messages(
     session_id: str = Path(..., description="Claude session ID to retrieve messages from"),
     session_manager: ChatSessionManager = Depends(get_chat_session_manager),
-) -> ChatHistoryResponse:
+) -> dict[str, Any]:
     """
     Retrieve message history for a Claude Code session.
 
@@ -174,46 +229,48 @@ async def get_session_messages(
             detail=f"Invalid session ID: {e}",
         )
 
-    # Validate session exists
-    if not session_manager.session_exists(validated_id):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session {validated_id} not found",
-        )
-
-    # Load messages from Claude Code session
+    # Load messages from Claude Code session (None means it does not exist)
     messages = session_manager.get_session_messages(
         validated_id,
         roles=["user", "assistant"],
     )
+    if messages is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session {validated_id} not found",
+        )
 
-    # Convert messages to response format, filtering out empty content
-    # Keep messages that have text content OR tool metadata
+    # Filter out empty content, keeping messages that have text OR tool metadata.
+    # Plain dicts are validated and serialized in one pass via response_model
+    # instead of constructing a ChatMessage per message in Python.
     chat_messages = [
-        ChatMessage(
-            role=msg["role"],
-            content=msg["content"],
-            timestamp=msg["timestamp"],
-            tool_name=msg.get("tool_name"),
-            tool_input=msg.get("tool_input"),
-        )
+        {
+            "role": msg["role"],
+            "content": content,
+            "timestamp": msg["timestamp"],
+            "tool_name": msg.get("tool_name"),
+            "tool_input": msg.get("tool_input"),
+        }
         for msg in messages
-        if (msg["content"] and msg["content"].strip()) or msg.get("tool_name")
+        if ((content := msg["content"]) and not content.isspace()) or msg.get("tool_name")
     ]
 
     logger.info("Retrieved %d messages for Claude session %s", len(chat_messages), validated_id)
 
-    return ChatHistoryResponse(
-        session_id=validated_id,
-        messages=chat_messages,
-        message_count=len(chat_messages),
-    )
+    return {
+        "session_id": validated_id,
+        "messages": chat_messages,
+        "message_count": len(chat_messages),
+    }
 
 
 @router.websocket("/ws/{session_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
     session_id: str,
+    replay_batch: bool = Query(
+        False, description="Replay buffered events in replay_batch frames (client opt-in)"
+    ),
     session_manager: ChatSessionManager = Depends(get_chat_session_manager),
     agent_session_manager: Any = Depends(get_agent_session_manager),
 ) -> None:
@@ -243,10 +300,12 @@ async def websocket_endpoint(
             {"type": "error", "error": "...", "isPermanent": true}
             {"type": "session_taken"}  # Sent when another client takes over
             {"type": "session_status", "session_id": "uuid", "status": "waiting", ...}
+            {"type": "replay_batch", "messages": [...]}  # Only with ?replay_batch=true
 
     Args:
         websocket: WebSocket connection
         session_id: Session identifier (Claude UUID, "new", or connection ID)
+        replay_batch: Pack buffered replay events into replay_batch frames
         session_manager: ChatSessionManager for managing sessions
         agent_session_manager: AgentSessionManager for managing agent sessions
     """
@@ -266,7 +325,7 @@ async def websocket_endpoint(
             return
 
     # Generate connection ID
-    connection_id = f"conn_{uuid4().hex[:16]}"
+    connection_id = f"conn_{secrets.token_hex(8)}"
 
     # Connect WebSocket
     connected = await connection_manager.connect(connection_id, websocket)
@@ -294,53 +353,57 @@ async def websocket_endpoint(
             connected_payload["session_id"] = agent_session.session_id
             connected_payload["sessionId"] = agent_session.session_id
 
-        await websocket.send_json(connected_payload)
+        await _send_json(websocket, connected_payload)
 
-        async with agent_session.ws_lock:
-            last_activity = agent_session.last_activity
-            completed_at = agent_session.completed_at
-            last_event_type = agent_session.last_event_type
-            is_processing = agent_session.is_processing
-            waiting_for_user = agent_session.waiting_for_user
-            pending_question_id = agent_session.pending_question_id
-            activity_status = agent_session_manager.get_activity_status(agent_session)
+        snapshot = await agent_session_manager.get_status_snapshot(agent_session)
 
         session_status_payload: dict[str, Any] = {
             "type": WSMessageType.SESSION_STATUS.value,
             "session_id": agent_session.session_id,
-            "is_processing": is_processing,
-            "waiting_for_user": waiting_for_user,
-            "pending_question_id": pending_question_id,
-            "status": activity_status,
-            "last_event_type": last_event_type,
+            "is_processing": snapshot.is_processing,
+            "waiting_for_user": snapshot.waiting_for_user,
+            "pending_question_id": snapshot.pending_question_id,
+            "status": snapshot.status,
+            "last_event_type": snapshot.last_event_type,
             "buffered_count": len(buffered),
-            "last_activity": last_activity.isoformat() if last_activity else None,
-            "completed_at": completed_at.isoformat() if completed_at else None,
+            "last_activity": snapshot.last_activity,
+            "completed_at": snapshot.completed_at,
         }
-        await websocket.send_json(session_status_payload)
+        await _send_json(websocket, session_status_payload)
 
-        # Replay buffered messages
-        for msg in buffered:
-            await websocket.send_json(msg)
+        # Replay buffered messages (one frame per chunk for clients that opted in)
+        if replay_batch and len(buffered) > 1:
+            for start in range(0, len(buffered), REPLAY_BATCH_SIZE):
+                await _send_json(
+                    websocket,
+                    {
+                        "type": WSMessageType.REPLAY_BATCH.value,
+                        "messages": buffered[start : start + REPLAY_BATCH_SIZE],
+                    },
+                )
+        else:
+            for msg in buffered:
+                await _send_json(websocket, msg)
         await agent_session_manager.finish_replay(agent_session, connection_id, connection_manager)
 
         # Listen for incoming messages
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = await _receive_json(websocket)
 
             # Parse message
             try:
-                msg = WSInputMessage(**data)
+                msg = WSInputMessage.model_validate(data)
 
                 if msg.type == WSMessageType.USER_MESSAGE:
                     user_message = msg.data.get("message")
                     if not user_message:
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {
                                 "type": WSMessageType.ERROR.value,
                                 "error": "Missing 'message' field in data",
-                            }
+                            },
                         )
                         continue
 
@@ -356,22 +419,24 @@ async def websocket_endpoint(
 
                 elif msg.type == WSMessageType.INTERRUPT:
                     # TODO: Implement interrupt support
-                    await websocket.send_json(
+                    await _send_json(
+                        websocket,
                         {
                             "type": WSMessageType.ERROR.value,
                             "error": "Interrupt not yet implemented",
-                        }
+                        },
                     )
 
                 elif msg.type == WSMessageType.ASK_USER_RESPONSE:
                     try:
-                        response_data = AskUserResponseData(**msg.data)
+                        response_data = AskUserResponseData.model_validate(msg.data)
                     except Exception as e:
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {
                                 "type": WSMessageType.ERROR.value,
                                 "error": f"Invalid ask_user_response: {e}",
-                            }
+                            },
                         )
                         continue
 
@@ -387,21 +452,23 @@ async def websocket_endpoint(
                     if outcome == "session_taken":
                         break
                     if outcome == "invalid":
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {
                                 "type": WSMessageType.ERROR.value,
                                 "error": error_message or "Invalid ask_user_response",
-                            }
+                            },
                         )
                     # ignored/accepted require no immediate response
 
             except Exception as e:
                 logger.error("Error handling message: %s", e)
-                await websocket.send_json(
+                await _send_json(
+                    websocket,
                     {
                         "type": WSMessageType.ERROR.value,
                         "error": f"Invalid message format: {e}",
-                    }
+                    },
                 )
 
     except WebSocketDisconnect:
@@ -1,10 +1,13 @@
 """API endpoints for accessing Claude Code session logs."""
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Iterator
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict
 
 from app.dependencies import (
@@ -86,7 +89,7 @@ async def list_sessions(
     claude_session_api: ClaudeSessionAPI = Depends(get_claude_session_api),
     agent_session_manager: AgentSessionManager = Depends(get_agent_session_manager),
     chat_title_service: ChatTitleService = Depends(get_chat_title_service),
-) -> SessionListResponse | JSONResponse:
+) -> dict[str, Any] | JSONResponse:
     """
     List available Claude Code sessions.
 
@@ -102,14 +105,18 @@ async def list_sessions(
     Returns:
         List of session metadata
     """
+    # Listing stats (and re-reads changed) session files: keep it off the event loop.
+    # Concurrent listings share the reader's metadata cache, which is lock-guarded.
     if query:
-        sessions = claude_session_api.search_sessions(
+        sessions = await asyncio.to_thread(
+            claude_session_api.search_sessions,
             query=query,
             include_agent_sessions=include_agent_sessions,
             limit=None,
         )
     else:
-        sessions = claude_session_api.list_sessions(
+        sessions = await asyncio.to_thread(
+            claude_session_api.list_sessions,
             include_agent_sessions=include_agent_sessions,
             limit=None,
         )
@@ -126,25 +133,27 @@ async def list_sessions(
             content={"error": "InvalidCursor", "message": str(exc)},
         )
 
-    activity_statuses = await agent_session_manager.get_session_activity_statuses()
-    titles = await chat_title_service.get_titles([session["session_id"] for session in page])
-    session_items: list[SessionListItem] = []
+    # Independent lookups: run them concurrently rather than back to back
+    activity_statuses, titles = await asyncio.gather(
+        agent_session_manager.get_session_activity_statuses(),
+        chat_title_service.get_titles([session["session_id"] for session in page]),
+    )
+    # Plain dicts: the response_model validates and serializes the page in one
+    # pass instead of building a SessionListItem per session in Python
+    session_items: list[dict[str, Any]] = []
     for session in page:
         session_id = session.get("session_id")
         title = titles.get(session_id) if isinstance(session_id, str) else None
         status_value = (
             activity_statuses.get(session_id, "done") if isinstance(session_id, str) else "done"
         )
-        is_running = status_value in ACTIVE_SESSION_STATUSES
         session_items.append(
-            SessionListItem(
-                **{
-                    **session,
-                    "title": title or session.get("summary") or None,
-                    "status": status_value,
-                    "is_running": is_running,
-                }
-            )
+            {
+                **session,
+                "title": title or session.get("summary") or None,
+                "status": status_value,
+                "is_running": status_value in ACTIVE_SESSION_STATUSES,
+            }
         )
 
     has_more = next_cursor is not None
@@ -157,25 +166,31 @@ async def list_sessions(
         },
     )
 
-    return SessionListResponse(
-        sessions=session_items,
-        total=len(page),
-        next_cursor=next_cursor,
-        has_more=has_more,
-    )
+    return {
+        "sessions": session_items,
+        "total": len(page),
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
 
 
 @router.get("/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
+    response: Response,
     session_id: str = Path(..., description="Session UUID or agent ID"),
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
     claude_session_api: ClaudeSessionAPI = Depends(get_claude_session_api),
     chat_title_service: ChatTitleService = Depends(get_chat_title_service),
-) -> SessionDetailResponse:
+) -> SessionDetailResponse | Response:
     """
     Get complete session data including all messages.
 
+    Supports conditional requests: a matching If-None-Match returns 304
+    without reading the session log.
+
     Args:
         session_id: Session UUID or agent ID (e.g., 'agent-a1917ad')
+        if_none_match: ETag from a previous response
 
     Returns:
         Complete session data with messages
@@ -192,6 +207,11 @@ async def get_session(
             detail=f"Invalid session ID: {e}",
         )
 
+    title = await chat_title_service.get_title(validated_id)
+    etag = claude_session_api.get_session_etag(validated_id, title=title)
+    if etag is not None and if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     session = claude_session_api.get_session(validated_id)
 
     if not session:
@@ -204,7 +224,9 @@ async def get_session(
         "Retrieved Claude session %s with %d messages", validated_id, session["message_count"]
     )
 
-    title = await chat_title_service.get_title(validated_id)
+    if etag is not None:
+        response.headers["ETag"] = etag
+
     return SessionDetailResponse(
         **{
             **session,
@@ -246,16 +268,13 @@ async def get_session_messages(
             detail=f"Invalid session ID: {e}",
         )
 
-    # Verify session exists
-    summary = claude_session_api.get_session_summary(validated_id)
-    if not summary:
+    messages = claude_session_api.get_session_messages(validated_id, roles=roles)
+    if messages is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Session {validated_id} not found",
         )
 
-    messages = claude_session_api.get_session_messages(validated_id, roles=roles)
-
     logger.info("Retrieved %d messages from Claude session %s", len(messages), validated_id)
 
     return MessageListResponse(
@@ -265,18 +284,73 @@ async def get_session_messages(
     )
 
 
-@router.get("/{session_id}/summary")
+@router.get("/{session_id}/messages.ndjson")
+async def stream_session_messages(
+    session_id: str = Path(..., description="Session UUID or agent ID"),
+    roles: list[str] | None = Query(
+        None,
+        description="Filter messages by role (user, assistant)",
+    ),
+    claude_session_api: ClaudeSessionAPI = Depends(get_claude_session_api),
+) -> StreamingResponse:
+    """
+    Stream messages from a session as newline-delimited JSON.
+
+    Same messages as /{session_id}/messages, one JSON object per line.
+    The session log is read incrementally, so long sessions start
+    rendering before the whole file has been read.
+
+    Args:
+        session_id: Session UUID or agent ID
+        roles: Optional list of roles to include
+
+    Returns:
+        application/x-ndjson stream of messages
+
+    Raises:
+        HTTPException: If session not found (404) or invalid (400)
+    """
+    # Validate session_id format to prevent path traversal
+    try:
+        validated_id = validate_session_id(session_id)
+    except PathValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid session ID: {e}",
+        )
+
+    if not await asyncio.to_thread(claude_session_api.session_exists, validated_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session {validated_id} not found",
+        )
+
+    def _ndjson_lines() -> Iterator[bytes]:
+        # Sync generator: Starlette iterates it in a worker thread
+        for message in claude_session_api.iter_session_messages(validated_id, roles=roles):
+            yield orjson.dumps(message) + b"\n"
+
+    logger.info("Streaming messages from Claude session %s", validated_id)
+
+    return StreamingResponse(_ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.get("/{session_id}/summary", response_model=None)
 async def get_session_summary(
+    response: Response,
     session_id: str = Path(..., description="Session UUID or agent ID"),
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
     claude_session_api: ClaudeSessionAPI = Depends(get_claude_session_api),
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     """
     Get session metadata without loading all messages.
 
-    Lightweight endpoint for getting session info quickly.
+    Lightweight endpoint for getting session info quickly. Supports
+    conditional requests via If-None-Match.
 
     Args:
         session_id: Session UUID or agent ID
+        if_none_match: ETag from a previous response
 
     Returns:
         Session metadata
@@ -293,6 +367,10 @@ async def get_session_summary(
             detail=f"Invalid session ID: {e}",
         )
 
+    etag = claude_session_api.get_session_etag(validated_id)
+    if etag is not None and if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     summary = claude_session_api.get_session_summary(validated_id)
 
     if not summary:
@@ -301,4 +379,7 @@ async def get_session_summary(
             detail=f"Session {validated_id} not found",
         )
 
+    if etag is not None:
+        response.headers["ETag"] = etag
+
     return summary
@@ -9,15 +9,9 @@ import re
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
-
-from app.dependencies import (
-    get_chat_title_service,
-    get_git_service,
-    get_log_service,
-    get_vault_service,
-    verify_token,
-)
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response
+
+from app.dependencies import verify_token
 from app.exceptions import VaultError
 from app.models.command import (
     CommandDetail,
@@ -26,6 +20,7 @@ from app.models.command import (
     TriggerCommandRequest,
     TriggerCommandResponse,
 )
+from app.services import container as container_module
 from app.services.background_tasks import safe_background_task
 from app.services.command_run_manager import RunStatus
 from app.services.command_run_post import sync_command_run
@@ -33,26 +28,35 @@ from app.utils.command_titles import format_command_title
 
 if TYPE_CHECKING:
     from app.services.agent import AgentService, ProcessResult
-    from app.services.chat_titles import ChatTitleService
     from app.services.command import CommandService
     from app.services.command_run_manager import CommandRunManager
-    from app.services.git import GitService
-    from app.services.logs import LogService
-    from app.services.vault import VaultService
+    from app.services.container import ServiceContainer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/commands", dependencies=[Depends(verify_token)])
 
+# Command names may not contain whitespace (checked on every trigger)
+_WHITESPACE_RE = re.compile(r"\s")
+
+# Status URL handed back to clients on trigger (run ID is appended)
+_RUN_URL_PREFIX = f"{router.prefix}/runs/"
+
+# Upper bound for the run status long-poll `wait` parameter
+MAX_RUN_STATUS_WAIT_SECONDS = 30.0
+
 
 def _format_command_title(command_name: str) -> str:
     return format_command_title(command_name)
 
 
-def get_command_service() -> CommandService:
+async def get_command_service() -> CommandService:
     """
     Dependency to get command service from container.
 
+    Async so FastAPI resolves it inline on the event loop; sync dependencies
+    are dispatched to the threadpool on every request.
+
     Returns:
         CommandService instance
 
@@ -60,15 +64,13 @@ def get_command_service() -> CommandService:
         HTTPException: If container not initialized
     """
     try:
-        from app.services import container as container_module
-
         container = container_module.get_container()
         return container.command_service
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail="Service container not initialized") from e
 
 
-def get_command_run_manager() -> CommandRunManager:
+async def get_command_run_manager() -> CommandRunManager:
     """
     Dependency to get command run manager from container.
 
@@ -79,15 +81,13 @@ def get_command_run_manager() -> CommandRunManager:
         HTTPException: If container not initialized
     """
     try:
-        from app.services import container as container_module
-
         container = container_module.get_container()
         return container.command_run_manager
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail="Service container not initialized") from e
 
 
-def get_agent_service() -> AgentService:
+async def get_agent_service() -> AgentService:
     """
     Dependency to get agent service from container.
 
@@ -98,18 +98,36 @@ def get_agent_service() -> AgentService:
         HTTPException: If container not initialized
     """
     try:
-        from app.services import container as container_module
-
         container = container_module.get_container()
         return container.agent_service
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail="Service container not initialized") from e
 
 
+async def get_service_container() -> ServiceContainer:
+    """
+    Dependency to get the whole service container.
+
+    For endpoints that need several services: one dependency resolution
+    per request instead of one per service.
+
+    Returns:
+        ServiceContainer instance
+
+    Raises:
+        HTTPException: If container not initialized
+    """
+    try:
+        return container_module.get_container()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail="Service container not initialized") from e
+
+
 @router.get("", response_model=CommandListResponse, response_model_by_alias=False)
 async def list_commands(
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
     command_service: CommandService = Depends(get_command_service),
-) -> CommandListResponse:
+) -> Response:
     """
     List all available slash commands.
 
@@ -125,17 +143,17 @@ async def list_commands(
     - Namespace (from subdirectory structure)
     - Argument hint (if specified in frontmatter)
     - Path to command file
+
+    Supports conditional requests: a matching If-None-Match returns 304.
+    The listing is serialized once per directory change and served as-is.
     """
     try:
-        response = command_service.list_commands()
-        logger.info(
-            "Listed commands",
-            extra={
-                "total": response.total,
-                "vault_commands": response.vault_commands,
-            },
-        )
-        return response
+        # Tree signature walk (and rescan on change) is blocking filesystem I/O
+        body, etag = await asyncio.to_thread(command_service.list_commands_json)
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except VaultError as e:
         logger.exception(
             "Failed to list commands",
@@ -184,7 +202,7 @@ async def get_command_detail(
         HTTPException: If command not found or cannot be read
     """
     try:
-        command_detail = command_service.get_command_detail(command_name)
+        command_detail = await asyncio.to_thread(command_service.get_command_detail, command_name)
         if command_detail is None:
             raise HTTPException(
                 status_code=404,
@@ -229,17 +247,116 @@ async def get_command_detail(
         ) from e
 
 
+async def _record_run_event(
+    run_id: str,
+    command_name: str,
+    services: ServiceContainer,
+    event_type: str,
+    data: dict[str, Any],
+) -> None:
+    """Capture a command run event and title the chat session it opens."""
+    await services.command_run_manager.append_event(run_id, event_type, data)
+    if event_type != "session_id":
+        return
+    session_id = data.get("session_id") or data.get("sessionId")
+    if not isinstance(session_id, str) or not session_id:
+        return
+    chat_title_service = services.chat_title_service
+    if await chat_title_service.title_exists(session_id):
+        return
+    title = format_command_title(command_name)
+    created_at = datetime.now(UTC).isoformat()
+    await chat_title_service.set_title(
+        session_id,
+        title,
+        created_at,
+        source="command",
+    )
+
+
+async def _execute_command_run(
+    run_id: str,
+    command_name: str,
+    arguments: str | None,
+    services: ServiceContainer,
+) -> None:
+    """Run a triggered command in the background and record its outcome."""
+    run_manager = services.command_run_manager
+    event_handler = functools.partial(_record_run_event, run_id, command_name, services)
+    result: ProcessResult | None = None
+    final_status = RunStatus.ERROR.value
+    error_message: str | None = None
+    try:
+        await run_manager.update_status(run_id, RunStatus.RUNNING)
+
+        result = await services.agent_service.run_command(
+            command_name,
+            arguments=arguments,
+            event_handler=event_handler,
+        )
+        if result is None:
+            message = "Command run returned no result"
+            raise RuntimeError(message)
+
+        # Update final status
+        if result["success"]:
+            final_status = RunStatus.COMPLETED.value
+            await run_manager.update_status(
+                run_id,
+                RunStatus.COMPLETED,
+                cost_usd=result["cost_usd"],
+                duration_ms=result["duration_ms"],
+            )
+        else:
+            final_status = RunStatus.ERROR.value
+            error_message = result["error"]
+            await run_manager.update_status(
+                run_id,
+                RunStatus.ERROR,
+                error=result["error"],
+                cost_usd=result["cost_usd"],
+                duration_ms=result["duration_ms"],
+            )
+
+    except Exception as e:
+        error_message = str(e)
+        logger.exception(
+            "Command execution failed",
+            extra={
+                "run_id": run_id,
+                "command_name": command_name,
+                "error": str(e),
+            },
+        )
+        await run_manager.update_status(
+            run_id,
+            RunStatus.ERROR,
+            error=str(e),
+        )
+    finally:
+        post_run_task = functools.partial(
+            sync_command_run,
+            command_name=command_name,
+            run_id=run_id,
+            status=final_status,
+            scheduled=False,
+            duration_ms=result["duration_ms"] if result else None,
+            duration_seconds=None,
+            cost_usd=result["cost_usd"] if result else None,
+            error=error_message,
+            git_service=services.git_service,
+            log_service=services.log_service,
+            vault_service=services.vault_service,
+        )
+        task_name = f"command_post_run:{command_name}:{run_id}"
+        asyncio.create_task(safe_background_task(task_name, post_run_task))
+
+
 @router.post("/{command_name}/trigger", response_model=TriggerCommandResponse)
 async def trigger_command(
     command_name: Annotated[str, Path(description="Command name (without leading slash)")],
     request: TriggerCommandRequest,
-    command_service: CommandService = Depends(get_command_service),
-    agent_service: AgentService = Depends(get_agent_service),
-    run_manager: CommandRunManager = Depends(get_command_run_manager),
-    chat_title_service: ChatTitleService = Depends(get_chat_title_service),
-    git_service: GitService = Depends(get_git_service),
-    log_service: LogService = Depends(get_log_service),
-    vault_service: VaultService = Depends(get_vault_service),
+    services: ServiceContainer = Depends(get_service_container),
 ) -> TriggerCommandResponse:
     """
     Manually trigger a slash command and return a run ID for polling.
@@ -257,20 +374,18 @@ async def trigger_command(
     Raises:
         HTTPException: If command not found or validation fails
     """
+    command_service = services.command_service
+    run_manager = services.command_run_manager
+
     # Validate command name format
-    if command_name.startswith("/") or re.search(r"\s", command_name):
+    if command_name.startswith("/") or _WHITESPACE_RE.search(command_name):
         raise HTTPException(
             status_code=400,
             detail="Command name must not start with '/' or contain whitespace",
         )
 
     # Verify command exists
-    commands = command_service.list_commands()
-    command_exists = any(
-        command_name in {cmd.name, f"{cmd.namespace}:{cmd.name}"} for cmd in commands.commands
-    )
-
-    if not command_exists:
+    if await asyncio.to_thread(command_service.get_command_by_name, command_name) is None:
         logger.warning(
             "Attempted to trigger unknown command",
             extra={"command_name": command_name},
@@ -283,97 +398,10 @@ async def trigger_command(
     # Create run
     run_id = await run_manager.create_run(command_name)
 
-    # Define event handler to capture output
-    async def event_handler(event_type: str, data: dict[str, Any]) -> None:
-        await run_manager.append_event(run_id, event_type, data)
-        if event_type != "session_id":
-            return
-        session_id = data.get("session_id") or data.get("sessionId")
-        if not isinstance(session_id, str) or not session_id:
-            return
-        if await chat_title_service.title_exists(session_id):
-            return
-        title = format_command_title(command_name)
-        created_at = datetime.now(UTC).isoformat()
-        await chat_title_service.set_title(
-            session_id,
-            title,
-            created_at,
-            source="command",
-        )
-
-    # Create background task to execute command
-    async def execute_command() -> None:
-        result: ProcessResult | None = None
-        final_status = RunStatus.ERROR.value
-        error_message: str | None = None
-        try:
-            await run_manager.update_status(run_id, RunStatus.RUNNING)
-
-            result = await agent_service.run_command(
-                command_name,
-                arguments=request.arguments,
-                event_handler=event_handler,
-            )
-            if result is None:
-                message = "Command run returned no result"
-                raise RuntimeError(message)
-
-            # Update final status
-            if result["success"]:
-                final_status = RunStatus.COMPLETED.value
-                await run_manager.update_status(
-                    run_id,
-                    RunStatus.COMPLETED,
-                    cost_usd=result["cost_usd"],
-                    duration_ms=result["duration_ms"],
-                )
-            else:
-                final_status = RunStatus.ERROR.value
-                error_message = result["error"]
-                await run_manager.update_status(
-                    run_id,
-                    RunStatus.ERROR,
-                    error=result["error"],
-                    cost_usd=result["cost_usd"],
-                    duration_ms=result["duration_ms"],
-                )
-
-        except Exception as e:
-            error_message = str(e)
-            logger.exception(
-                "Command execution failed",
-                extra={
-                    "run_id": run_id,
-                    "command_name": command_name,
-                    "error": str(e),
-                },
-            )
-            await run_manager.update_status(
-                run_id,
-                RunStatus.ERROR,
-                error=str(e),
-            )
-        finally:
-            post_run_task = functools.partial(
-                sync_command_run,
-                command_name=command_name,
-                run_id=run_id,
-                status=final_status,
-                scheduled=False,
-                duration_ms=result["duration_ms"] if result else None,
-                duration_seconds=None,
-                cost_usd=result["cost_usd"] if result else None,
-                error=error_message,
-                git_service=git_service,
-                log_service=log_service,
-                vault_service=vault_service,
-            )
-            task_name = f"command_post_run:{command_name}:{run_id}"
-            asyncio.create_task(safe_background_task(task_name, post_run_task))
-
     # Start background task
-    task = asyncio.create_task(execute_command())
+    task = asyncio.create_task(
+        _execute_command_run(run_id, command_name, request.arguments, services)
+    )
     await run_manager.set_task(run_id, task)
 
     logger.info(
@@ -387,7 +415,7 @@ async def trigger_command(
     return TriggerCommandResponse(
         run_id=run_id,
         status="started",
-        poll_url=f"/api/v1/commands/runs/{run_id}",
+        poll_url=_RUN_URL_PREFIX + run_id,
     )
 
 
@@ -397,8 +425,16 @@ async def get_command_run_status(
     after: Annotated[
         int | None, Query(description="Return only events after this event_id")
     ] = None,
+    wait: Annotated[
+        float,
+        Query(
+            ge=0,
+            le=MAX_RUN_STATUS_WAIT_SECONDS,
+            description="Long-poll: seconds to wait for new events on an active run",
+        ),
+    ] = 0,
     run_manager: CommandRunManager = Depends(get_command_run_manager),
-) -> CommandRunStatusResponse:
+) -> dict[str, Any]:
     """
     Get status and output events for a command run.
 
@@ -406,6 +442,10 @@ async def get_command_run_status(
     - First call: GET /commands/runs/{run_id}
     - Subsequent calls: GET /commands/runs/{run_id}?after={next_cursor}
 
+    Pass `wait` (seconds) to long-poll instead of polling in a tight loop:
+    while the run is active and has no events after the cursor, the request
+    is held until a new event or status change arrives or `wait` elapses.
+
     The response includes:
     - Current status (started, running, completed, error)
     - Events since the cursor (text chunks, tool calls, thinking, completion)
@@ -415,6 +455,7 @@ async def get_command_run_status(
     Args:
         run_id: Run identifier from trigger response
         after: Optional event_id cursor for polling
+        wait: Long-poll timeout in seconds (0 returns immediately)
 
     Returns:
         Run status with events and metadata
@@ -422,7 +463,7 @@ async def get_command_run_status(
     Raises:
         HTTPException: If run not found or expired
     """
-    status = await run_manager.get_run_status(run_id, after_event_id=after)
+    status = await run_manager.get_run_status(run_id, after_event_id=after, wait_seconds=wait)
 
     if status is None:
         logger.warning(
@@ -434,4 +475,5 @@ async def get_command_run_status(
             detail=f"Run '{run_id}' not found or expired",
         )
 
-    return CommandRunStatusResponse(**status)
+    # response_model validates and serializes the dict in one pass
+    return status
@@ -1,22 +1,79 @@
 """File content API for previewing vault files."""
 
+import asyncio
 import logging
 import mimetypes
+import os
+import re
+import stat
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from pydantic import BaseModel
 
-from app.dependencies import get_vault_service, verify_token
+from app.dependencies import get_vault_browser_service, get_vault_service, verify_token
 from app.services.vault import VaultService
+from app.services.vault_browser import VaultBrowserService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/files", dependencies=[Depends(verify_token)])
 
 
+# A ".." path component (path traversal)
+_TRAVERSAL_RE = re.compile(r"(?:^|/)\.\.(?:/|$)")
+
+# File extension -> language identifier for syntax highlighting
+_LANGUAGE_MAP = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "javascript",
+    ".tsx": "typescript",
+    ".md": "markdown",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "zsh",
+    ".swift": "swift",
+    ".go": "go",
+    ".rs": "rust",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".html": "html",
+    ".css": "css",
+    ".xml": "xml",
+    ".sql": "sql",
+}
+
+# Leading bytes inspected for NUL when sniffing binary content
+_SNIFF_BYTES = 8192
+
+# Extensions always treated as binary
+_BINARY_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".pdf",
+    ".zip",
+    ".tar",
+    ".gz",
+    ".exe",
+    ".bin",
+    ".so",
+    ".dylib",
+    ".dll",
+}
+
+
 class FileContentResponse(BaseModel):
     """File content response model."""
 
@@ -34,7 +91,7 @@ def validate_safe_path(path_str: str, vault_path: Path) -> Path:
 
     Args:
         path_str: Relative path string from request
-        vault_path: Absolute path to vault root
+        vault_path: Resolved absolute path to vault root
 
     Returns:
         Resolved absolute path
@@ -54,8 +111,7 @@ def validate_safe_path(path_str: str, vault_path: Path) -> Path:
         try:
             # Try to make the absolute path relative to the vault
             abs_path = Path(path_str)
-            vault_resolved = vault_path.resolve()
-            path_str = str(abs_path.relative_to(vault_resolved))
+            path_str = str(abs_path.relative_to(vault_path))
         except ValueError:
             # Path is absolute but not under vault - reject it
             raise HTTPException(
@@ -67,17 +123,17 @@ def validate_safe_path(path_str: str, vault_path: Path) -> Path:
     path_str = path_str.strip("/")
 
     # Reject paths with .. components (path traversal)
-    if ".." in Path(path_str).parts:
+    if _TRAVERSAL_RE.search(path_str):
         raise HTTPException(status_code=400, detail="Path traversal (..) not allowed")
 
     # Resolve the full path
     full_path = (vault_path / path_str).resolve()
 
     # Ensure the resolved path is still within vault
-    try:
-        full_path.relative_to(vault_path.resolve())
-    except ValueError as err:
-        raise HTTPException(status_code=403, detail="Access denied: path outside vault") from err
+    if full_path != vault_path and not str(full_path).startswith(
+        str(vault_path).rstrip(os.sep) + os.sep
+    ):
+        raise HTTPException(status_code=403, detail="Access denied: path outside vault")
 
     return full_path
 
@@ -93,139 +149,189 @@ def detect_language(file_path: Path) -> str | None:
         Language identifier (e.g., 'python', 'javascript', 'markdown')
     """
     ext = file_path.suffix.lower()
-    language_map = {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".jsx": "javascript",
-        ".tsx": "typescript",
-        ".md": "markdown",
-        ".json": "json",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".toml": "toml",
-        ".sh": "bash",
-        ".bash": "bash",
-        ".zsh": "zsh",
-        ".swift": "swift",
-        ".go": "go",
-        ".rs": "rust",
-        ".c": "c",
-        ".cpp": "cpp",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".html": "html",
-        ".css": "css",
-        ".xml": "xml",
-        ".sql": "sql",
-    }
-    return language_map.get(ext)
+    return _LANGUAGE_MAP.get(ext)
 
 
-def is_binary_file(file_path: Path) -> bool:
+def is_binary_file(file_path: Path, head: bytes | None = None) -> bool:
     """
     Check if a file is binary.
 
+    Known binary extensions are rejected outright. Other files are binary
+    if their MIME type is not text (skipped for the source/text extensions
+    in the language map) or their first bytes contain a NUL byte.
+
     Args:
         file_path: Path to the file
+        head: Leading bytes of the file if already read (read here otherwise)
 
     Returns:
         True if file appears to be binary
     """
-    # Check by MIME type first
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if mime_type and not mime_type.startswith("text/"):
+    ext = file_path.suffix.lower()
+    if ext in _BINARY_EXTENSIONS:
         return True
 
-    # Check by extension
-    binary_extensions = {
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".gif",
-        ".pdf",
-        ".zip",
-        ".tar",
-        ".gz",
-        ".exe",
-        ".bin",
-        ".so",
-        ".dylib",
-        ".dll",
-    }
-    return file_path.suffix.lower() in binary_extensions
+    if ext not in _LANGUAGE_MAP:
+        mime_type, _ = mimetypes.guess_type(file_path.name)
+        if mime_type and not mime_type.startswith("text/"):
+            return True
 
+    # Text files never contain NUL bytes; most binary formats do early on
+    if head is None:
+        with file_path.open("rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    return b"\x00" in head[:_SNIFF_BYTES]
 
-@router.get("/content")
-async def get_file_content(
-    path: Annotated[str, Query(description="Relative path from vault root")],
-    lines: Annotated[
-        int | None, Query(description="Max lines to return (default: all)", ge=1)
-    ] = None,
-    offset: Annotated[int | None, Query(description="Line offset for pagination", ge=0)] = 0,
-    vault_service: VaultService = Depends(get_vault_service),
-) -> FileContentResponse:
+
+def _slice_lines(data: bytes, start: int, limit: int | None) -> tuple[bytes, int]:
     """
-    Get file content from vault.
+    Cut a window of lines out of raw file bytes.
 
-    Returns file content with metadata for preview in the app.
-    Only serves files within the vault directory.
+    Lines end at ``\n`` (so ``\r\n`` endings stay intact) and keep their
+    terminator; a trailing line without one still counts.
+
+    Args:
+        data: Raw file content
+        start: Index of the first line to return
+        limit: Maximum number of lines to return (None for all remaining)
+
+    Returns:
+        Tuple of (window bytes, total line count)
     """
-    vault_path = vault_service.vault_path
+    total_lines = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        total_lines += 1
+    if start >= total_lines:
+        return b"", total_lines
 
-    # Validate and resolve path
-    full_path = validate_safe_path(path, vault_path)
+    begin = 0
+    for _ in range(start):
+        begin = data.index(b"\n", begin) + 1
+    if limit is None:
+        return data[begin:], total_lines
+
+    end = begin
+    for _ in range(limit):
+        newline = data.find(b"\n", end)
+        if newline == -1:
+            end = len(data)
+            break
+        end = newline + 1
+    return data[begin:end], total_lines
+
+
+def _check_file(full_path: Path) -> os.stat_result:
+    """
+    Stat and sniff a vault file for preview (blocking, run in a worker thread).
+
+    Args:
+        full_path: Resolved path inside the vault
 
+    Returns:
+        stat result of the file
+
+    Raises:
+        HTTPException: If the file is missing, not a regular file, binary
+            or unreadable
+    """
     # Check if file exists
-    if not full_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    try:
+        st = full_path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found") from None
 
     # Check if it's a file (not a directory)
-    if not full_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=400, detail="Path is not a file")
 
-    # Check if binary
-    if is_binary_file(full_path):
+    try:
+        with full_path.open("rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError as err:
+        logger.error("Failed to read file %s: %s", full_path, err)
+        raise HTTPException(status_code=500, detail="Failed to read file") from err
+    if is_binary_file(full_path, head):
         raise HTTPException(status_code=400, detail="Binary file preview not supported")
 
-    # Read file content
+    return st
+
+
+def _load_preview(full_path: Path, offset: int, lines: int | None) -> dict[str, Any]:
+    """
+    Check and read a vault file for preview (blocking, run in a worker thread).
+
+    Args:
+        full_path: Resolved path inside the vault
+        offset: Index of the first line to return
+        lines: Maximum number of lines to return (None for all)
+
+    Returns:
+        Content, size, line count and mtime for the response
+
+    Raises:
+        HTTPException: If the file is unreadable or not UTF-8
+    """
+    # Read raw bytes; only the requested window is decoded
+    try:
+        with full_path.open("rb") as f:
+            data = f.read()
+            st = os.fstat(f.fileno())
+    except OSError as err:
+        logger.error("Failed to read file %s: %s", full_path, err)
+        raise HTTPException(status_code=500, detail="Failed to read file") from err
+
+    window, total_lines = _slice_lines(data, offset, lines)
     try:
-        content = full_path.read_text(encoding="utf-8")
+        content = window.decode("utf-8")
     except UnicodeDecodeError as err:
         raise HTTPException(
             status_code=400, detail="File encoding not supported (non-UTF-8)"
         ) from err
-    except OSError as err:
-        logger.error("Failed to read file %s: %s", full_path, err)
-        raise HTTPException(status_code=500, detail="Failed to read file") from err
 
-    # Split into lines for pagination
-    all_lines = content.splitlines(keepends=True)
-    total_lines = len(all_lines)
+    return {
+        "content": content,
+        "size_bytes": st.st_size,
+        "lines": total_lines,
+        "modified_at": datetime.fromtimestamp(st.st_mtime, tz=UTC),
+    }
 
-    # Apply offset and line limit
-    start = offset or 0
-    if start >= total_lines:
-        # Offset beyond file length
-        selected_lines = []
-    else:
-        end = start + lines if lines else total_lines
-        selected_lines = all_lines[start:end]
-
-    content_to_return = "".join(selected_lines)
-
-    # Get file stats
-    stat = full_path.stat()
-    modified_at = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-
-    # Detect language
-    language = detect_language(full_path)
-
-    return FileContentResponse(
-        path=path,
-        content=content_to_return,
-        size_bytes=stat.st_size,
-        lines=total_lines,
-        language=language,
-        modified_at=modified_at,
-    )
+
+@router.get("/content", response_model=FileContentResponse)
+async def get_file_content(
+    response: Response,
+    path: Annotated[str, Query(description="Relative path from vault root")],
+    lines: Annotated[
+        int | None, Query(description="Max lines to return (default: all)", ge=1)
+    ] = None,
+    offset: Annotated[int | None, Query(description="Line offset for pagination", ge=0)] = 0,
+    *,
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+    vault_service: VaultService = Depends(get_vault_service),
+    vault_browser: VaultBrowserService = Depends(get_vault_browser_service),
+) -> FileContentResponse | Response:
+    """
+    Get file content from vault.
+
+    Returns file content with metadata for preview in the app.
+    Only serves files within the vault directory.
+
+    Clients that want the raw bytes should use `/api/v1/vault/files/content`,
+    which also supports Range requests.
+
+    Responses carry an `ETag`; a matching `If-None-Match` gets a 304
+    without reading the whole file.
+    """
+    # Validate and resolve path
+    full_path = validate_safe_path(path, vault_service.resolved_vault_path)
+
+    # Binary and missing files are rejected before answering 304
+    st = await asyncio.to_thread(_check_file, full_path)
+    etag = vault_browser.generate_file_etag(st.st_size, st.st_mtime_ns)
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # Disk reads and the line scan block; keep them off the event loop
+    preview = await asyncio.to_thread(_load_preview, full_path, offset or 0, lines)
+
+    response.headers["ETag"] = etag
+    return FileContentResponse(path=path, language=detect_language(full_path), **preview)
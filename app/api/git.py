@@ -1,5 +1,6 @@
 """Git operations API endpoints."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -46,7 +47,8 @@ async def get_status(
     Get list of uncommitted files.
 
     Returns list of files that have been modified, added, or deleted
-    but not yet committed to git.
+    but not yet committed to git. Polls within half a second of each
+    other share one status scan.
     """
     if not git_service.enabled:
         return GitStatusResponse(
@@ -56,7 +58,7 @@ async def get_status(
         )
 
     try:
-        changed_files = git_service.get_changed_files()
+        changed_files = await asyncio.to_thread(git_service.get_changed_files_cached)
         return GitStatusResponse(
             enabled=True,
             changed_files=changed_files,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.dependencies import get_health_service, verify_token
 from app.models.health import HealthCheckResponse
@@ -57,6 +57,7 @@ async def health_ready(
 
 @router.get("/health/detailed", response_model=HealthCheckResponse)
 async def health_detailed(
+    fresh: bool = Query(default=False, description="Bypass the cached result"),
     health_service: HealthCheckService = Depends(get_health_service),
     _: None = Depends(verify_token),
 ) -> HealthCheckResponse:
@@ -64,9 +65,10 @@ async def health_detailed(
     Detailed health check (requires authentication).
 
     Returns complete health status of all services with detailed information.
-    Requires valid bearer token for authentication.
+    Requires valid bearer token for authentication. Pass `fresh=true` to
+    skip the short-lived result cache shared with readiness probes.
 
     Returns:
         HealthCheckResponse with complete service details
     """
-    return await health_service.check_health()
+    return await health_service.check_health(fresh=fresh)
@@ -2,7 +2,7 @@
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from app.config import settings
 from app.dependencies import get_push_notification_service, verify_token
@@ -105,6 +105,7 @@ async def send_notification(
             sent=summary.sent,
             failed=summary.failed,
             invalid_tokens_removed=summary.invalid_tokens_removed,
+            suppressed=summary.suppressed,
             devices=summary.device_results,
         )
 
@@ -126,36 +127,14 @@ async def send_notification(
 async def list_devices(
     device_filter: str | None = None,
     _: None = Depends(verify_token),
-) -> DeviceListResponse:
-    """List registered devices with optional filtering."""
+) -> Response:
+    """List registered devices with optional filtering (push_url redacted)."""
     try:
-        devices = await device_registry.list_devices(
+        body = await device_registry.get_safe_snapshot(
             devices_file=settings.apn_devices_file,
             device_filter=device_filter,
         )
-
-        # Return devices with push_url redacted (security)
-        safe_devices = [
-            {
-                "installation_id": d.installation_id,
-                "device_name": d.device_name,
-                "device_type": d.device_type,
-                "registered_at": d.registered_at,
-                "last_seen": d.last_seen,
-                # Never return push_url (contains secret)
-            }
-            for d in devices
-        ]
-
-        logger.debug(
-            "Listed devices",
-            extra={"count": len(safe_devices), "filter": device_filter},
-        )
-
-        return DeviceListResponse(
-            total=len(safe_devices),
-            devices=safe_devices,
-        )
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.exception(
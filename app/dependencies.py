@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hmac
 from typing import TYPE_CHECKING
 
 from fastapi import Depends, HTTPException, status
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
     from app.services.claude_session_api import ClaudeSessionAPI
     from app.services.command_run_manager import CommandRunManager
     from app.services.git import GitService
+    from app.services.git_debouncer import GitCommitDebouncer
     from app.services.health import HealthCheckService
     from app.services.inbox import InboxService
     from app.services.logs import LogService
@@ -38,7 +40,8 @@ async def verify_token(
     Verify the bearer token matches configured AUTH_TOKEN.
 
     Uses the dynamic settings proxy to get the current auth_token,
-    which may have been reloaded from config.yaml.
+    which may have been reloaded from config.yaml. The comparison is
+    constant-time so response timing does not leak the token.
     """
     if credentials is None:
         raise HTTPException(
@@ -46,7 +49,9 @@ async def verify_token(
             detail="Not authenticated",
         )
 
-    if credentials.credentials != settings.auth_token:
+    if not hmac.compare_digest(
+        credentials.credentials.encode("utf-8"), settings.auth_token.encode("utf-8")
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token",
@@ -77,6 +82,12 @@ async def get_git_service() -> GitService:
     return container.git_service
 
 
+async def get_git_commit_debouncer() -> GitCommitDebouncer:
+    """Get git commit debouncer via dependency injection."""
+    container = get_container()
+    return container.git_commit_debouncer
+
+
 async def get_inbox_service() -> InboxService:
     """Get inbox service via dependency injection."""
     container = get_container()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 try:
     from app.utils.json_formatter import JsonFormatter
@@ -11,6 +15,26 @@ except ImportError:
     JsonFormatter = None  # type: ignore[misc,assignment]
 
 
+_queue_listener: QueueListener | None = None
+
+
+class InProcessQueueHandler(QueueHandler):
+    """Queue handler that defers formatting to the listener thread.
+
+    The stdlib ``QueueHandler.prepare`` fully formats each record so it can be
+    pickled. Records here never leave the process, so only the message args
+    are resolved (they may be mutated after the call returns) and the
+    formatter, including exception rendering, runs on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve message args on the calling thread, keep everything else."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class RequestIDFilter(logging.Filter):
     """Add request ID to log records."""
 
@@ -48,25 +72,29 @@ def configure_json_logging(
 ) -> None:
     """Configure application logging with optional JSON output.
 
+    Log calls only enqueue the record; a background ``QueueListener`` thread
+    formats and writes it to stdout so request handlers never block on I/O.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         use_json: Whether to use JSON output (True) or text output (False)
     """
+    global _queue_listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers (and drain the previous listener, if any)
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Create stdout handler
+    # Create stdout handler (driven by the queue listener thread)
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setLevel(getattr(logging, log_level.upper()))
 
-    # Add request ID filter to all handlers
-    request_id_filter = RequestIDFilter()
-    stream_handler.addFilter(request_id_filter)
-
     if use_json and JsonFormatter is not None:
         # JSON formatter with structured fields including request_id
         json_formatter = JsonFormatter(
@@ -82,7 +110,16 @@ def configure_json_logging(
         )
         stream_handler.setFormatter(text_formatter)
 
-    root_logger.addHandler(stream_handler)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    queue_handler = InProcessQueueHandler(log_queue)
+
+    # Request ID lives in a context variable, so it must be read on the
+    # calling thread before the record is handed to the listener
+    queue_handler.addFilter(RequestIDFilter())
+    root_logger.addHandler(queue_handler)
+
+    _queue_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _queue_listener.start()
 
     # Suppress noisy loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -95,6 +132,18 @@ def configure_json_logging(
     uvicorn_access_logger.addFilter(health_check_filter)
 
 
+def stop_logging_listener() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
 
@@ -37,10 +37,12 @@ from app.services.command import CommandService
 from app.services.command_run_manager import CommandRunManager
 from app.services.container import init_container
 from app.services.git import GitService
+from app.services.git_debouncer import GitCommitDebouncer
 from app.services.health import HealthCheckService
 from app.services.inbox import InboxService
 from app.services.lock import init_vault_lock
 from app.services.logs import LogService
+from app.services.push_gate import PushGate
 from app.services.push_notifications import PushNotificationService
 from app.services.relay_client import PrimePushRelayClient
 from app.services.schedule import ScheduleService
@@ -124,6 +126,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     )
 
     inbox_service = InboxService()
+    git_commit_debouncer = GitCommitDebouncer(git_service=git_service)
 
     prime_api_url = settings.base_url or "http://localhost:8000"
 
@@ -174,6 +177,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     push_notification_service = PushNotificationService(
         devices_file=settings.apn_devices_file,
         relay_client=relay_client,
+        gate=PushGate(),
     )
 
     # Initialize chat title service
@@ -242,6 +246,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         command_run_manager=command_run_manager,
         agent_identity_service=agent_identity_service,
         schedule_service=schedule_service,
+        git_commit_debouncer=git_commit_debouncer,
     )
 
     if settings.git_enabled:
@@ -275,6 +280,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Stop schedule loop
     await schedule_service.stop()
 
+    # Flush any capture auto-commit still waiting in its debounce window
+    await git_commit_debouncer.stop()
+
+    # Close pooled relay connections
+    await relay_client.aclose()
+
 
 app = FastAPI(
     title="Prime Server",
@@ -75,6 +75,7 @@ class WSMessageType(str, Enum):
     SESSION_ID = "session_id"
     SESSION_TAKEN = "session_taken"
     SESSION_STATUS = "session_status"
+    REPLAY_BATCH = "replay_batch"
     ASK_USER_QUESTION = "ask_user_question"
     ASK_USER_TIMEOUT = "ask_user_timeout"
     TEXT = "text"
@@ -36,7 +36,7 @@ class DeviceResult(BaseModel):
     """Result for a single device notification."""
 
     name: str = Field(..., description="Device name or type")
-    status: str = Field(..., description="Status (sent, failed, invalid_token, etc)")
+    status: str = Field(..., description="Status (sent, failed, invalid_binding, suppressed)")
     error: str | None = Field(None, description="Error message if failed")
 
 
@@ -50,6 +50,10 @@ class NotificationSendResponse(BaseModel):
         ...,
         description="Number of invalid tokens auto-removed",
     )
+    suppressed: int = Field(
+        0,
+        description="Number of sends held back by rate limiting or duplicate suppression",
+    )
     devices: list[DeviceResult] = Field(..., description="Per-device results")
 
 
@@ -70,6 +70,19 @@ class AgentSessionState:
     title_task_started: bool = False
 
 
+@dataclass(frozen=True)
+class SessionStatusSnapshot:
+    """Point-in-time view of a session's activity, taken under its ws_lock."""
+
+    is_processing: bool
+    waiting_for_user: bool
+    pending_question_id: str | None
+    status: SessionActivityStatus
+    last_event_type: str | None
+    last_activity: str | None
+    completed_at: str | None
+
+
 class AgentSessionManager:
     """
     Manages long-lived agent sessions independent of WebSocket connections.
@@ -167,6 +180,21 @@ class AgentSessionManager:
         """Return activity status for a session state instance."""
         return self._derive_activity_status(state)
 
+    async def get_status_snapshot(self, state: AgentSessionState) -> SessionStatusSnapshot:
+        """Capture a consistent status snapshot in a single ws_lock hold."""
+        async with state.ws_lock:
+            last_activity = state.last_activity
+            completed_at = state.completed_at
+            return SessionStatusSnapshot(
+                is_processing=state.is_processing,
+                waiting_for_user=state.waiting_for_user,
+                pending_question_id=state.pending_question_id,
+                status=self._derive_activity_status(state),
+                last_event_type=state.last_event_type,
+                last_activity=last_activity.isoformat() if last_activity else None,
+                completed_at=completed_at.isoformat() if completed_at else None,
+            )
+
     async def get_or_create_session(self, session_id: str | None) -> AgentSessionState:
         """
         Get existing session or create new one.
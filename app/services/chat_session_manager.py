@@ -51,17 +51,15 @@ class ChatSessionManager:
             True if session exists, False otherwise
         """
         try:
-            # Try to get session summary to check if it exists
-            summary = self.claude_api.get_session_summary(session_id)
-            return summary is not None
-        except Exception:
+            return self.claude_api.session_exists(session_id)
+        except OSError:
             return False
 
     def get_session_messages(
         self,
         session_id: str,
         roles: list[str] | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[dict[str, Any]] | None:
         """
         Get messages from Claude Code session.
 
@@ -70,7 +68,8 @@ class ChatSessionManager:
             roles: Optional list of roles to filter (e.g., ["user", "assistant"])
 
         Returns:
-            List of message dictionaries with role, content, timestamp
+            List of message dictionaries with role, content, timestamp,
+            or None if the session was not found
         """
         return self.claude_api.get_session_messages(session_id, roles=roles)
 
@@ -55,15 +55,31 @@ class ChatTitleService:
 
     def __init__(self, titles_file: Path) -> None:
         self.titles_file = titles_file
+        # Parsed store reused while the file's (mtime_ns, size) is unchanged
+        self._cached_store: ChatTitleStore | None = None
+        self._cached_stat: tuple[int, int] | None = None
+
+    def _file_stat(self) -> tuple[int, int] | None:
+        try:
+            stat = self.titles_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def _load_titles(self) -> ChatTitleStore:
-        if not self.titles_file.exists():
+        file_stat = self._file_stat()
+        if file_stat is None:
+            self._cached_store = None
+            self._cached_stat = None
             return ChatTitleStore()
 
+        if self._cached_store is not None and self._cached_stat == file_stat:
+            return self._cached_store
+
         try:
             with self.titles_file.open("r") as f:
                 data = json.load(f)
-            return ChatTitleStore(**data)
+            store = ChatTitleStore(**data)
         except (json.JSONDecodeError, OSError, ValueError) as e:
             logger.error(
                 "Failed to load chat titles",
@@ -75,6 +91,10 @@ class ChatTitleService:
             )
             return ChatTitleStore()
 
+        self._cached_store = store
+        self._cached_stat = file_stat
+        return store
+
     def _save_titles(self, store: ChatTitleStore) -> None:
         self.titles_file.parent.mkdir(parents=True, exist_ok=True)
         temp_file = self.titles_file.with_suffix(".json.tmp")
@@ -86,11 +106,16 @@ class ChatTitleService:
 
             temp_file.replace(self.titles_file)
             self.titles_file.chmod(0o600)
+            self._cached_store = store
+            self._cached_stat = self._file_stat()
             logger.debug(
                 "Chat titles saved",
                 extra={"path": str(self.titles_file), "titles_count": len(store.titles)},
             )
         except OSError as e:
+            # The cached store may hold the unsaved entry; force a reload
+            self._cached_store = None
+            self._cached_stat = None
             logger.error(
                 "Failed to save chat titles",
                 extra={
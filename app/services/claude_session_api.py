@@ -1,6 +1,8 @@
 """API service for Claude Code sessions."""
 
+import hashlib
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -68,7 +70,7 @@ class ClaudeSessionAPI:
         self,
         session_id: str,
         roles: list[str] | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[dict[str, Any]] | None:
         """
         Get messages from a session, optionally filtered by role.
 
@@ -77,25 +79,43 @@ class ClaudeSessionAPI:
             roles: Optional list of roles to include (e.g., ["user", "assistant"])
 
         Returns:
-            List of message dictionaries
+            List of message dictionaries, or None if the session was not found
         """
         session = self.reader.get_session(session_id)
         if not session:
-            return []
+            return None
+
+        return [
+            self._message_to_dict(msg)
+            for msg in session.messages
+            if self._include_message(msg, roles)
+        ]
+
+    def iter_session_messages(
+        self,
+        session_id: str,
+        roles: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yield messages from a session, optionally filtered by role.
 
-        messages = []
-        for msg in session.messages:
-            # Skip non-message types
-            if msg.type not in ("user", "assistant"):
-                continue
+        Reads the session log line by line, so memory stays flat regardless
+        of session length. Yields nothing if the session does not exist.
 
-            # Filter by role if specified
-            if roles and msg.role not in roles:
-                continue
+        Args:
+            session_id: Session UUID or agent ID
+            roles: Optional list of roles to include (e.g., ["user", "assistant"])
 
-            messages.append(self._message_to_dict(msg))
+        Yields:
+            Message dictionaries in the same format as get_session_messages
+        """
+        jsonl_file = self.reader.get_session_file(session_id)
+        if jsonl_file is None:
+            return
 
-        return messages
+        for msg in self.reader.iter_messages(jsonl_file):
+            if self._include_message(msg, roles):
+                yield self._message_to_dict(msg)
 
     def get_session_summary(self, session_id: str) -> dict[str, Any] | None:
         """
@@ -107,11 +127,42 @@ class ClaudeSessionAPI:
         Returns:
             Session metadata dictionary or None if not found
         """
-        sessions = self.reader.list_sessions(include_agent_sessions=True)
-        for session in sessions:
-            if session["session_id"] == session_id:
-                return session
-        return None
+        return self.reader.get_session_summary(session_id)
+
+    def get_session_etag(self, session_id: str, *, title: str | None = None) -> str | None:
+        """
+        Generate a strong ETag for a session from its log file's stat metadata.
+
+        Session logs are append-only, so size and mtime change whenever a
+        message is added. This lets callers answer conditional requests
+        without parsing the log.
+
+        Args:
+            session_id: Session UUID or agent ID
+            title: Stored chat title, for responses that include it
+
+        Returns:
+            Quoted ETag string, or None if the session does not exist
+        """
+        stat = self.reader.get_session_stat(session_id)
+        if stat is None:
+            return None
+
+        raw = f"{session_id}:{stat.st_size}:{stat.st_mtime_ns}:{title or ''}"
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return f'"{digest}"'
+
+    def session_exists(self, session_id: str) -> bool:
+        """
+        Check whether a session exists without reading it.
+
+        Args:
+            session_id: Session UUID or agent ID
+
+        Returns:
+            True if the session exists
+        """
+        return self.reader.session_exists(session_id)
 
     def search_sessions(
         self,
@@ -143,6 +194,13 @@ class ClaudeSessionAPI:
 
         return sessions[:limit]
 
+    @staticmethod
+    def _include_message(message: ClaudeMessage, roles: list[str] | None) -> bool:
+        """Keep user/assistant messages, filtered by role if specified."""
+        if message.type not in ("user", "assistant"):
+            return False
+        return not roles or message.role in roles
+
     def _session_to_dict(self, session: ClaudeSession) -> dict[str, Any]:
         """Convert ClaudeSession to dictionary format."""
         return {
@@ -2,6 +2,9 @@
 
 import json
 import logging
+import os
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -102,6 +105,11 @@ class ClaudeSessionReader:
         self.project_path = Path(project_path)
         self.claude_home = Path(claude_home)
         self.sessions_dir = get_project_sessions_dir(project_path, claude_home)
+        # Per-file metadata keyed on (mtime_ns, size) so listings only
+        # re-read session files that changed since the last scan
+        self._metadata_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+        # Listings and searches run in worker threads and share the cache
+        self._metadata_lock = threading.Lock()
 
     def list_sessions(
         self,
@@ -130,41 +138,31 @@ class ClaudeSessionReader:
             return []
 
         sessions = []
+        seen_files: set[Path] = set()
         for jsonl_file in self.sessions_dir.glob("*.jsonl"):
+            seen_files.add(jsonl_file)
             is_agent = jsonl_file.name.startswith("agent-")
 
             if not include_agent_sessions and is_agent:
                 continue
 
-            # Extract session ID from filename
-            session_id = jsonl_file.stem  # Remove .jsonl extension
-
             # Try to read basic metadata without loading full session
             try:
-                metadata = self._read_session_metadata(jsonl_file)
-                sessions.append(
-                    {
-                        "session_id": session_id,
-                        "file_path": str(jsonl_file),
-                        "is_agent_session": is_agent,
-                        "created_at": (
-                            metadata["created_at"].isoformat()
-                            if metadata.get("created_at")
-                            else None
-                        ),
-                        "last_activity": (
-                            metadata["last_activity"].isoformat()
-                            if metadata.get("last_activity")
-                            else None
-                        ),
-                        "message_count": metadata.get("message_count", 0),
-                        "summary": metadata.get("summary"),
-                    }
-                )
+                sessions.append(self._build_session_summary(jsonl_file))
             except Exception as e:
-                logger.warning("Failed to read session %s: %s", session_id, e)
+                logger.warning("Failed to read session %s: %s", jsonl_file.stem, e)
                 continue
 
+        # Forget sessions whose files were deleted. A concurrent listing may
+        # have cached files this scan did not see, so only drop missing ones.
+        with self._metadata_lock:
+            unseen = [path for path in self._metadata_cache if path not in seen_files]
+        deleted = [path for path in unseen if not path.exists()]
+        if deleted:
+            with self._metadata_lock:
+                for stale_file in deleted:
+                    self._metadata_cache.pop(stale_file, None)
+
         # Sort by last activity (newest first), tie-breaker by session_id (desc)
         sessions.sort(
             key=lambda s: (s["last_activity"] or "", s["session_id"]),
@@ -173,6 +171,54 @@ class ClaudeSessionReader:
 
         return sessions
 
+    def session_exists(self, session_id: str) -> bool:
+        """
+        Check whether a session log exists (single stat, no file read).
+
+        Args:
+            session_id: Session UUID or agent ID
+
+        Returns:
+            True if the session's JSONL file exists
+        """
+        return (self.sessions_dir / f"{session_id}.jsonl").is_file()
+
+    def get_session_stat(self, session_id: str) -> os.stat_result | None:
+        """
+        Stat a session log without reading it.
+
+        Args:
+            session_id: Session UUID or agent ID
+
+        Returns:
+            stat result for the session's JSONL file, or None if it does not exist
+        """
+        try:
+            return (self.sessions_dir / f"{session_id}.jsonl").stat()
+        except FileNotFoundError:
+            return None
+
+    def get_session_summary(self, session_id: str) -> dict[str, Any] | None:
+        """
+        Get metadata for one session without scanning the whole directory.
+
+        Args:
+            session_id: Session UUID or agent ID
+
+        Returns:
+            Session metadata dictionary (same keys as list_sessions), or
+            None if the session does not exist or cannot be read
+        """
+        jsonl_file = self.sessions_dir / f"{session_id}.jsonl"
+        if not jsonl_file.is_file():
+            return None
+
+        try:
+            return self._build_session_summary(jsonl_file)
+        except Exception as e:
+            logger.warning("Failed to read session %s: %s", session_id, e)
+            return None
+
     def get_session(self, session_id: str) -> ClaudeSession | None:
         """
         Load a complete session with all messages.
@@ -183,9 +229,8 @@ class ClaudeSessionReader:
         Returns:
             ClaudeSession object or None if not found
         """
-        jsonl_file = self.sessions_dir / f"{session_id}.jsonl"
-        if not jsonl_file.exists():
-            logger.warning("Session file not found: %s", jsonl_file)
+        jsonl_file = self.get_session_file(session_id)
+        if jsonl_file is None:
             return None
 
         try:
@@ -194,6 +239,75 @@ class ClaudeSessionReader:
             logger.exception("Failed to read session %s", session_id)
             return None
 
+    def get_session_file(self, session_id: str) -> Path | None:
+        """
+        Resolve the JSONL log file for a session.
+
+        Args:
+            session_id: Session UUID or agent ID
+
+        Returns:
+            Path to the session file, or None if it does not exist
+        """
+        jsonl_file = self.sessions_dir / f"{session_id}.jsonl"
+        if not jsonl_file.exists():
+            logger.warning("Session file not found: %s", jsonl_file)
+            return None
+        return jsonl_file
+
+    def iter_messages(self, jsonl_file: Path) -> Iterator[ClaudeMessage]:
+        """
+        Yield messages from a session file one line at a time.
+
+        Unlike get_session, only the current line is held in memory, so
+        long sessions can be streamed without loading the whole log.
+
+        Args:
+            jsonl_file: Path to JSONL session file
+
+        Yields:
+            Parsed ClaudeMessage objects (summary lines are skipped)
+        """
+        for line_num, data in self._iter_lines(jsonl_file):
+            if data.get("type") == "summary":
+                continue
+            message = self._parse_message(data, jsonl_file, line_num)
+            if message is not None:
+                yield message
+
+    def _build_session_summary(self, jsonl_file: Path) -> dict[str, Any]:
+        """Build the session metadata dictionary returned by listings."""
+        metadata = self._get_session_metadata(jsonl_file)
+        return {
+            "session_id": jsonl_file.stem,
+            "file_path": str(jsonl_file),
+            "is_agent_session": jsonl_file.name.startswith("agent-"),
+            "created_at": (
+                metadata["created_at"].isoformat() if metadata.get("created_at") else None
+            ),
+            "last_activity": (
+                metadata["last_activity"].isoformat() if metadata.get("last_activity") else None
+            ),
+            "message_count": metadata.get("message_count", 0),
+            "summary": metadata.get("summary"),
+        }
+
+    def _get_session_metadata(self, jsonl_file: Path) -> dict[str, Any]:
+        """Return session metadata, re-reading the file only if it changed."""
+        stat = jsonl_file.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._metadata_lock:
+            cached = self._metadata_cache.get(jsonl_file)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        # Read outside the lock so slow files do not serialize other listings
+        metadata = self._read_session_metadata(jsonl_file)
+        with self._metadata_lock:
+            self._metadata_cache[jsonl_file] = (file_key, metadata)
+        return metadata
+
     def _read_session_metadata(self, jsonl_file: Path) -> dict[str, Any]:
         """
         Read minimal session metadata without loading all messages.
@@ -268,6 +382,20 @@ class ClaudeSessionReader:
             agent_id=agent_id,
         )
 
+        for line_num, data in self._iter_lines(jsonl_file):
+            # Handle summary line (usually first line)
+            if data.get("type") == "summary":
+                session.summary = data.get("summary")
+                continue
+
+            message = self._parse_message(data, jsonl_file, line_num)
+            if message is not None:
+                session.messages.append(message)
+
+        return session
+
+    def _iter_lines(self, jsonl_file: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (line_num, record) for each valid JSON line in a session file."""
         with jsonl_file.open("r", encoding="utf-8") as f:
             for line_num, raw_line in enumerate(f):
                 line = raw_line.strip()
@@ -276,41 +404,6 @@ class ClaudeSessionReader:
 
                 try:
                     data = json.loads(line)
-                    msg_type = data.get("type")
-
-                    # Handle summary line (usually first line)
-                    if msg_type == "summary":
-                        session.summary = data.get("summary")
-                        continue
-
-                    # Skip non-message lines
-                    if msg_type not in (
-                        "user",
-                        "assistant",
-                        "file-history-snapshot",
-                    ):
-                        continue
-
-                    # Parse message
-                    timestamp_str = data.get("timestamp")
-                    timestamp = (
-                        datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                        if timestamp_str
-                        else datetime.now()
-                    )
-
-                    message = ClaudeMessage(
-                        uuid=data.get("uuid", ""),
-                        parent_uuid=data.get("parentUuid"),
-                        timestamp=timestamp,
-                        type=msg_type,
-                        message=data.get("message"),
-                        is_sidechain=data.get("isSidechain", False),
-                        agent_id=data.get("agentId"),
-                    )
-
-                    session.messages.append(message)
-
                 except json.JSONDecodeError:
                     logger.warning(
                         "Invalid JSON in %s line %d",
@@ -318,13 +411,49 @@ class ClaudeSessionReader:
                         line_num + 1,
                     )
                     continue
-                except Exception as e:
-                    logger.warning(
-                        "Error parsing line %d in %s: %s",
-                        line_num + 1,
-                        jsonl_file.name,
-                        e,
-                    )
-                    continue
 
-        return session
+                if isinstance(data, dict):
+                    yield line_num, data
+
+    def _parse_message(
+        self,
+        data: dict[str, Any],
+        jsonl_file: Path,
+        line_num: int,
+    ) -> ClaudeMessage | None:
+        """Build a ClaudeMessage from a JSONL record, or None for non-message lines."""
+        msg_type = data.get("type")
+
+        # Skip non-message lines
+        if msg_type not in (
+            "user",
+            "assistant",
+            "file-history-snapshot",
+        ):
+            return None
+
+        try:
+            timestamp_str = data.get("timestamp")
+            timestamp = (
+                datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                if timestamp_str
+                else datetime.now()
+            )
+
+            return ClaudeMessage(
+                uuid=data.get("uuid", ""),
+                parent_uuid=data.get("parentUuid"),
+                timestamp=timestamp,
+                type=msg_type,
+                message=data.get("message"),
+                is_sidechain=data.get("isSidechain", False),
+                agent_id=data.get("agentId"),
+            )
+        except Exception as e:
+            logger.warning(
+                "Error parsing line %d in %s: %s",
+                line_num + 1,
+                jsonl_file.name,
+                e,
+            )
+            return None
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
 
 from app.exceptions import VaultError
@@ -17,6 +20,20 @@ from app.utils.frontmatter import parse_and_validate_command
 
 logger = logging.getLogger(__name__)
 
+# (full path, mtime_ns, size) for every entry under the commands directory
+TreeSignature = tuple[tuple[str, int, int], ...]
+
+
+@dataclass(frozen=True)
+class _CommandSnapshot:
+    """Parsed command listing for one state of the commands directory."""
+
+    signature: TreeSignature
+    response: CommandListResponse
+    body: bytes
+    index: dict[str, CommandInfo]
+    etag: str
+
 
 class CommandService:
     """Service for scanning and parsing Claude slash commands."""
@@ -30,17 +47,41 @@ class CommandService:
         """
         self.vault_path = Path(vault_path)
         self.commands_dir = self.vault_path / ".claude" / "commands"
+        self._snapshot: _CommandSnapshot | None = None
 
     def list_commands(self) -> CommandListResponse:
         """
         List all available slash commands.
 
+        The parsed listing is reused until a file or folder under the
+        commands directory is added, removed or modified.
+
         Returns:
             CommandListResponse with all discovered commands
 
         Raises:
             VaultError: If vault is inaccessible
         """
+        return self._get_snapshot().response
+
+    def list_commands_json(self) -> tuple[bytes, str]:
+        """
+        List all available slash commands as pre-serialized JSON.
+
+        The body is encoded once per directory change, so cached listings
+        can be served without re-validating or re-encoding the model.
+
+        Returns:
+            Tuple of (JSON body bytes, quoted strong ETag)
+
+        Raises:
+            VaultError: If vault is inaccessible
+        """
+        snapshot = self._get_snapshot()
+        return snapshot.body, snapshot.etag
+
+    def _get_snapshot(self) -> _CommandSnapshot:
+        """Return the cached listing, rescanning only if the directory changed."""
         if not self.vault_path.exists():
             msg = "Vault path does not exist"
             raise VaultError(
@@ -48,6 +89,47 @@ class CommandService:
                 context={"vault_path": str(self.vault_path)},
             )
 
+        signature = self._tree_signature()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+
+        response = self._scan_commands()
+        digest = hashlib.sha256(repr(signature).encode("utf-8")).hexdigest()
+        snapshot = _CommandSnapshot(
+            signature=signature,
+            response=response,
+            body=response.model_dump_json(by_alias=False).encode("utf-8"),
+            index=self._build_command_index(response.commands),
+            etag=f'"{digest}"',
+        )
+        self._snapshot = snapshot
+        return snapshot
+
+    def _tree_signature(self) -> TreeSignature:
+        """Stat every entry under the commands directory (no file reads)."""
+        entries: list[tuple[str, int, int]] = []
+        pending = [self.commands_dir]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+                        if entry.is_dir():
+                            pending.append(Path(entry.path))
+            except OSError:
+                # Missing or unreadable: the scan itself reports real errors
+                continue
+        entries.sort()
+        return tuple(entries)
+
+    def _scan_commands(self) -> CommandListResponse:
+        """Scan and parse every command file."""
         commands: list[CommandInfo] = []
 
         # Scan vault commands
@@ -75,6 +157,24 @@ class CommandService:
             mcp_commands=mcp_count,
         )
 
+    def get_command_by_name(self, command_name: str) -> CommandInfo | None:
+        """
+        Look up a command by name or namespaced name.
+
+        Matches either the bare command name (e.g. ``test``) or its
+        namespaced form (e.g. ``frontend:test``).
+
+        Args:
+            command_name: Name of the command (without leading slash)
+
+        Returns:
+            CommandInfo if found, None otherwise
+
+        Raises:
+            VaultError: If vault is inaccessible
+        """
+        return self._get_snapshot().index.get(command_name)
+
     def get_command_detail(self, command_name: str) -> CommandDetail | None:
         """
         Get detailed information about a specific command.
@@ -107,6 +207,16 @@ class CommandService:
         )
         return None
 
+    @staticmethod
+    def _build_command_index(commands: list[CommandInfo]) -> dict[str, CommandInfo]:
+        """Index commands by bare and namespaced name (first match wins)."""
+        index: dict[str, CommandInfo] = {}
+        for command in commands:
+            index.setdefault(command.name, command)
+            if command.namespace:
+                index.setdefault(f"{command.namespace}:{command.name}", command)
+        return index
+
     def _scan_directory(
         self, directory: Path, command_type: CommandType, namespace: str | None = None
     ) -> list[CommandInfo]:
@@ -2,12 +2,15 @@
 Service for managing command run state and output events.
 
 Stores command execution state in memory with bounded event buffers
-for HTTP polling-based output retrieval.
+for HTTP polling-based output retrieval. Pollers may long-poll: they
+park on a per-run waker until a new event or status change arrives.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
 from collections import deque
 from dataclasses import dataclass, field
@@ -36,6 +39,11 @@ class RunEvent:
     type: str
     data: dict[str, Any] = field(default_factory=dict)
 
+    @functools.cached_property
+    def payload(self) -> dict[str, Any]:
+        """Flattened event as returned to pollers (built once, shared by every read)."""
+        return {"event_id": self.event_id, "type": self.type, **self.data}
+
 
 @dataclass
 class CommandRun:
@@ -53,6 +61,12 @@ class CommandRun:
     next_event_id: int = 0
     dropped_before: int = 0
     task: asyncio.Task[None] | None = None
+    waker: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def notify(self) -> None:
+        """Wake current long-pollers and arm a fresh waker for the next ones."""
+        self.waker.set()
+        self.waker = asyncio.Event()
 
 
 class CommandRunManager:
@@ -145,6 +159,7 @@ class CommandRunManager:
                 run.cost_usd = cost_usd
             if duration_ms is not None:
                 run.duration_ms = duration_ms
+            run.notify()
 
         logger.info(
             "Updated command run status",
@@ -165,35 +180,43 @@ class CommandRunManager:
             event_type: Event type (text, tool_use, thinking, complete, error)
             data: Event payload
         """
-        async with self._lock:
-            run = self._runs.get(run_id)
-            if not run:
-                logger.warning(
-                    "Attempted to append event to non-existent run",
-                    extra={"run_id": run_id},
-                )
-                return
+        # Called once per streamed chunk. The update never awaits, so it is
+        # atomic on the event loop without taking the manager lock.
+        run = self._runs.get(run_id)
+        if not run:
+            logger.warning(
+                "Attempted to append event to non-existent run",
+                extra={"run_id": run_id},
+            )
+            return
 
-            event_id = run.next_event_id
-            run.next_event_id += 1
+        event_id = run.next_event_id
+        run.next_event_id += 1
 
-            # Check if buffer is full and will evict oldest event
-            if len(run.events) == run.events.maxlen:
-                run.dropped_before = run.events[0].event_id + 1
+        # Check if buffer is full and will evict oldest event
+        if len(run.events) == run.events.maxlen:
+            run.dropped_before = run.events[0].event_id + 1
 
-            run.events.append(RunEvent(event_id=event_id, type=event_type, data=data))
+        run.events.append(RunEvent(event_id=event_id, type=event_type, data=data))
+        run.notify()
 
-        logger.debug(
-            "Appended event to run",
-            extra={
-                "run_id": run_id,
-                "event_id": event_id,
-                "event_type": event_type,
-            },
-        )
+        # Per-chunk path: skip building the extra dict unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Appended event to run",
+                extra={
+                    "run_id": run_id,
+                    "event_id": event_id,
+                    "event_type": event_type,
+                },
+            )
 
     async def get_run_status(
-        self, run_id: str, after_event_id: int | None = None
+        self,
+        run_id: str,
+        after_event_id: int | None = None,
+        *,
+        wait_seconds: float = 0.0,
     ) -> dict[str, Any] | None:
         """
         Get run status and events.
@@ -201,6 +224,9 @@ class CommandRunManager:
         Args:
             run_id: Run identifier
             after_event_id: Return only events after this ID (for polling)
+            wait_seconds: Long-poll timeout. When the run is still active and
+                has nothing after the cursor, wait up to this long for a new
+                event or status change before answering (default: 0)
 
         Returns:
             Dictionary with run status, events, and metadata, or None if run not found
@@ -210,34 +236,52 @@ class CommandRunManager:
             if not run:
                 return None
 
-            # Filter events by cursor
-            events = list(run.events)
-            if after_event_id is not None:
-                events = [e for e in events if e.event_id > after_event_id]
-
-            # Build response; use -1 when no events exist to avoid skipping event_id=0.
-            next_cursor = run.next_event_id - 1 if run.next_event_id > 0 else -1
-
-            return {
-                "run_id": run.run_id,
-                "command_name": run.command_name,
-                "status": run.status.value,
-                "started_at": run.started_at.isoformat(),
-                "completed_at": run.completed_at.isoformat() if run.completed_at else None,
-                "cost_usd": run.cost_usd,
-                "duration_ms": run.duration_ms,
-                "error": run.error,
-                "events": [
-                    {
-                        "event_id": e.event_id,
-                        "type": e.type,
-                        **e.data,
-                    }
-                    for e in events
-                ],
-                "next_cursor": next_cursor,
-                "dropped_before": run.dropped_before,
-            }
+            if wait_seconds <= 0 or not self._is_idle(run, after_event_id):
+                return self._build_status(run, after_event_id)
+
+            waker = run.waker
+
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(waker.wait(), timeout=wait_seconds)
+
+        async with self._lock:
+            run = self._runs.get(run_id)
+            if not run:
+                return None
+            return self._build_status(run, after_event_id)
+
+    @staticmethod
+    def _is_idle(run: CommandRun, after_event_id: int | None) -> bool:
+        """Return True if an active run has no events past the cursor."""
+        if run.status not in (RunStatus.STARTED, RunStatus.RUNNING):
+            return False
+        cursor = -1 if after_event_id is None else after_event_id
+        return run.next_event_id - 1 <= cursor
+
+    @staticmethod
+    def _build_status(run: CommandRun, after_event_id: int | None) -> dict[str, Any]:
+        """Build the status payload for a run (caller holds the lock)."""
+        # Filter events by cursor
+        events = list(run.events)
+        if after_event_id is not None:
+            events = [e for e in events if e.event_id > after_event_id]
+
+        # Build response; use -1 when no events exist to avoid skipping event_id=0.
+        next_cursor = run.next_event_id - 1 if run.next_event_id > 0 else -1
+
+        return {
+            "run_id": run.run_id,
+            "command_name": run.command_name,
+            "status": run.status.value,
+            "started_at": run.started_at.isoformat(),
+            "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+            "cost_usd": run.cost_usd,
+            "duration_ms": run.duration_ms,
+            "error": run.error,
+            "events": [e.payload for e in events],
+            "next_cursor": next_cursor,
+            "dropped_before": run.dropped_before,
+        }
 
     async def set_task(self, run_id: str, task: asyncio.Task[None]) -> None:
         """
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from app.services.command import CommandService
     from app.services.command_run_manager import CommandRunManager
     from app.services.git import GitService
+    from app.services.git_debouncer import GitCommitDebouncer
     from app.services.health import HealthCheckService
     from app.services.inbox import InboxService
     from app.services.logs import LogService
@@ -59,6 +60,7 @@ class ServiceContainer:
         command_run_manager: CommandRunManager,
         agent_identity_service: AgentIdentityService,
         schedule_service: ScheduleService,
+        git_commit_debouncer: GitCommitDebouncer,
     ) -> None:
         """Initialize service container with all required services."""
         self.vault_service = vault_service
@@ -80,6 +82,7 @@ class ServiceContainer:
         self.command_run_manager = command_run_manager
         self.agent_identity_service = agent_identity_service
         self.schedule_service = schedule_service
+        self.git_commit_debouncer = git_commit_debouncer
 
 
 _container: ServiceContainer | None = None
@@ -105,6 +108,7 @@ def init_container(
     schedule_service: ScheduleService,
     vault_browser_service: VaultBrowserService | None = None,
     vault_search_service: VaultSearchService | None = None,
+    git_commit_debouncer: GitCommitDebouncer | None = None,
 ) -> None:
     """Initialize service container (called once in FastAPI lifespan).
 
@@ -128,6 +132,7 @@ def init_container(
         command_run_manager: CommandRunManager for managing command runs
         agent_identity_service: AgentIdentityService for persistent agent ID
         schedule_service: ScheduleService for scheduled commands
+        git_commit_debouncer: GitCommitDebouncer for coalesced capture auto-commits
     """
     global _container
 
@@ -141,6 +146,11 @@ def init_container(
 
         vault_search_service = VaultSearchService(vault_service=vault_service)
 
+    if git_commit_debouncer is None:
+        from app.services.git_debouncer import GitCommitDebouncer
+
+        git_commit_debouncer = GitCommitDebouncer(git_service=git_service)
+
     _container = ServiceContainer(
         vault_service=vault_service,
         vault_browser_service=vault_browser_service,
@@ -161,6 +171,7 @@ def init_container(
         command_run_manager=command_run_manager,
         agent_identity_service=agent_identity_service,
         schedule_service=schedule_service,
+        git_commit_debouncer=git_commit_debouncer,
     )
 
 
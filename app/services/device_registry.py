@@ -10,13 +10,29 @@ from datetime import UTC, datetime
 from pathlib import Path  # noqa: TC003
 from typing import Literal
 
+import orjson
 from pydantic import BaseModel
 
+from app.models.push import DeviceListResponse
+
 logger = logging.getLogger(__name__)
 
 # Async lock for file operations (initialized in event loop)
 _file_lock: asyncio.Lock | None = None
 
+# File identity used to validate cached reads: (st_mtime_ns, st_size),
+# or None when the file does not exist
+_FileSignature = tuple[int, int] | None
+
+# Parsed devices.json per path, reused while the file signature matches.
+# Entries are shared between callers and must not be mutated.
+_devices_cache: dict[Path, tuple[_FileSignature, list[Device]]] = {}
+
+# Serialized GET /devices bodies keyed by (devices_file, device_filter).
+# save_devices clears both caches; the signature catches outside edits.
+_safe_json_cache: dict[tuple[Path, str | None], tuple[_FileSignature, bytes]] = {}
+_SAFE_JSON_CACHE_MAX_ENTRIES = 64
+
 
 class Device(BaseModel):
     """Device registration entry."""
@@ -92,9 +108,8 @@ def load_devices(devices_file: Path) -> DeviceRegistry:
         return DeviceRegistry()
 
     try:
-        with devices_file.open("r") as f:
-            data = json.load(f)
-            return DeviceRegistry(**data)
+        data = orjson.loads(devices_file.read_bytes())
+        return DeviceRegistry(**data)
     except (json.JSONDecodeError, OSError) as e:
         logger.error("Failed to load devices file: %s", e)
         # Return empty structure on error
@@ -116,12 +131,14 @@ def save_devices(devices_file: Path, registry: DeviceRegistry) -> None:
     temp_file = devices_file.with_suffix(".json.tmp")
 
     try:
-        with temp_file.open("w") as f:
-            json.dump(registry.model_dump(), f, indent=2)
+        with temp_file.open("wb") as f:
+            f.write(orjson.dumps(registry.model_dump(), option=orjson.OPT_INDENT_2))
             f.flush()
 
         # Atomic rename
         temp_file.replace(devices_file)
+        _devices_cache.pop(devices_file, None)
+        _safe_json_cache.clear()
 
         # Set secure permissions (only owner can read/write)
         devices_file.chmod(0o600)
@@ -162,7 +179,7 @@ async def add_or_update_device(
     now = datetime.now(UTC).isoformat()
 
     async with get_file_lock():
-        registry = load_devices(devices_file)
+        registry = await asyncio.to_thread(load_devices, devices_file)
 
         # Check if device already exists
         existing = None
@@ -213,7 +230,7 @@ async def add_or_update_device(
                 sanitized_name,
             )
 
-        save_devices(devices_file, registry)
+        await asyncio.to_thread(save_devices, devices_file, registry)
 
 
 async def remove_device(
@@ -234,7 +251,7 @@ async def remove_device(
         True if device was found and removed, False otherwise
     """
     async with get_file_lock():
-        registry = load_devices(devices_file)
+        registry = await asyncio.to_thread(load_devices, devices_file)
 
         # Find and remove device
         original_count = len(registry.devices)
@@ -242,7 +259,7 @@ async def remove_device(
         removed = len(registry.devices) < original_count
 
         if removed:
-            save_devices(devices_file, registry)
+            await asyncio.to_thread(save_devices, devices_file, registry)
             logger.info("Device unregistered: id=%s", installation_id)
         else:
             logger.warning("Device not found: id=%s", installation_id)
@@ -250,6 +267,45 @@ async def remove_device(
         return removed
 
 
+async def remove_devices(
+    devices_file: Path,
+    installation_ids: set[str],
+) -> int:
+    """
+    Remove several devices with a single registry write.
+
+    Used to drop every binding that came back 410 Gone during one send.
+
+    Args:
+        devices_file: Path to devices.json
+        installation_ids: UUIDs from app to remove
+
+    Returns:
+        Number of devices found and removed
+    """
+    if not installation_ids:
+        return 0
+
+    async with get_file_lock():
+        registry = await asyncio.to_thread(load_devices, devices_file)
+
+        original_count = len(registry.devices)
+        registry.devices = [
+            d for d in registry.devices if d.installation_id not in installation_ids
+        ]
+        removed = original_count - len(registry.devices)
+
+        if removed:
+            await asyncio.to_thread(save_devices, devices_file, registry)
+        logger.info(
+            "Devices unregistered: removed=%d, requested=%d",
+            removed,
+            len(installation_ids),
+        )
+
+        return removed
+
+
 async def get_device(
     devices_file: Path,
     installation_id: str,
@@ -265,9 +321,9 @@ async def get_device(
         Device if found, None otherwise
     """
     async with get_file_lock():
-        registry = load_devices(devices_file)
+        devices = await _load_devices_cached(devices_file)
 
-        for device in registry.devices:
+        for device in devices:
             if device.installation_id == installation_id:
                 return device
 
@@ -289,23 +345,105 @@ async def list_devices(
         List of Device objects matching filter
     """
     async with get_file_lock():
-        registry = load_devices(devices_file)
+        devices = await _load_devices_cached(devices_file)
+        return _filter_devices(devices, device_filter)
 
-        if not device_filter:
-            return registry.devices
 
-        # Filter by device name or type
-        filter_lower = device_filter.lower()
-        filtered = []
-        for device in registry.devices:
-            # Match device type
-            if device.device_type == filter_lower:
-                filtered.append(device)
-                continue
+async def get_safe_snapshot(
+    devices_file: Path,
+    device_filter: str | None = None,
+) -> bytes:
+    """
+    Get the JSON body for GET /devices with push_url redacted.
+
+    The serialized body is cached per filter until the next save_devices call.
+
+    Args:
+        devices_file: Path to devices.json
+        device_filter: Filter by device name or type (iphone, ipad, mac)
+
+    Returns:
+        DeviceListResponse serialized as JSON bytes
+    """
+    key = (devices_file, device_filter)
+    async with get_file_lock():
+        signature = _file_signature(devices_file)
+        cached = _safe_json_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        devices = _filter_devices(await _load_devices_cached(devices_file), device_filter)
+        safe_devices = [
+            # Never return push_url (contains secret)
+            device.model_dump(exclude={"push_url"})
+            for device in devices
+        ]
+        # The dicts come from validated Device models; skip revalidating them
+        body = (
+            DeviceListResponse.model_construct(
+                total=len(safe_devices),
+                devices=safe_devices,
+            )
+            .model_dump_json()
+            .encode("utf-8")
+        )
+
+        if len(_safe_json_cache) >= _SAFE_JSON_CACHE_MAX_ENTRIES:
+            _safe_json_cache.clear()
+        _safe_json_cache[key] = (signature, body)
+        return body
 
-            # Match device name (case insensitive)
-            if device.device_name and filter_lower in device.device_name.lower():
-                filtered.append(device)
-                continue
 
-        return filtered
+def _file_signature(devices_file: Path) -> _FileSignature:
+    """Stat devices.json for cache validation."""
+    try:
+        st = devices_file.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+async def _load_devices_cached(devices_file: Path) -> list[Device]:
+    """
+    Load devices, reusing the parsed file while it is unchanged on disk.
+
+    Callers must hold the file lock and must not mutate the returned devices.
+
+    Args:
+        devices_file: Path to devices.json
+
+    Returns:
+        Devices currently stored in the file
+    """
+    # Stat before reading: if the file changes in between, the stale
+    # signature simply forces another load on the next call
+    signature = _file_signature(devices_file)
+    cached = _devices_cache.get(devices_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    registry = await asyncio.to_thread(load_devices, devices_file)
+    _devices_cache[devices_file] = (signature, registry.devices)
+    return registry.devices
+
+
+def _filter_devices(devices: list[Device], device_filter: str | None) -> list[Device]:
+    """Filter devices by type or case-insensitive name substring."""
+    if not device_filter:
+        return list(devices)
+
+    # Filter by device name or type
+    filter_lower = device_filter.lower()
+    filtered = []
+    for device in devices:
+        # Match device type
+        if device.device_type == filter_lower:
+            filtered.append(device)
+            continue
+
+        # Match device name (case insensitive)
+        if device.device_name and filter_lower in device.device_name.lower():
+            filtered.append(device)
+            continue
+
+    return filtered
@@ -1,5 +1,7 @@
 import logging
 import subprocess
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -35,6 +37,9 @@ class GitService:
         self.user_email = user_email
         self.timeout_seconds = timeout_seconds
         self._repo: git.Repo | None = None
+        # (monotonic timestamp, changed files) of the last status scan
+        self._status_cache: tuple[float, list[str]] | None = None
+        self._status_lock = threading.Lock()
 
     def initialize(self) -> None:
         """
@@ -152,6 +157,7 @@ class GitService:
             # GitPython doesn't support direct timeout, so we use git_command_timeout env var
             with self._repo.git.custom_environment(GIT_TERMINAL_PROMPT="0"):
                 origin.pull()
+            self._status_cache = None
             logger.debug("Git pull completed")
         except subprocess.TimeoutExpired as e:
             msg = f"Git pull timed out after {self.timeout_seconds}s"
@@ -209,6 +215,28 @@ class GitService:
             )
             return []
 
+    def get_changed_files_cached(self, max_age_seconds: float = 0.5) -> list[str]:
+        """
+        Get changed files, reusing a scan younger than ``max_age_seconds``.
+
+        Concurrent callers wait for the in-flight scan instead of each
+        running their own. Commits and pulls drop the cached result.
+
+        Args:
+            max_age_seconds: Maximum age of a reused result
+
+        Returns:
+            List of paths relative to vault root
+        """
+        with self._status_lock:
+            cached = self._status_cache
+            if cached is not None and time.monotonic() - cached[0] < max_age_seconds:
+                return list(cached[1])
+
+            changed = self.get_changed_files()
+            self._status_cache = (time.monotonic(), changed)
+            return list(changed)
+
     def commit(self, message: str, paths: list[str]) -> None:
         """
         Stage files and commit (if Git is enabled).
@@ -247,6 +275,7 @@ class GitService:
 
             # Commit
             self._repo.index.commit(message)
+            self._status_cache = None
             logger.debug(
                 "Git commit completed",
                 extra={
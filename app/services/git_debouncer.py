@@ -0,0 +1,78 @@
+"""Coalescing scheduler for git auto-commits.
+
+Captures used to queue one ``auto_commit_and_push`` per request. Under a burst
+of captures that serializes N git commit+push cycles where one would cover all
+of the new files. The debouncer collapses every request that arrives within a
+short window into a single auto-commit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from app.services.background_tasks import safe_background_task
+
+if TYPE_CHECKING:
+    from app.services.git import GitService
+
+logger = logging.getLogger(__name__)
+
+
+class GitCommitDebouncer:
+    """Run at most one git auto-commit per debounce window."""
+
+    def __init__(self, git_service: GitService, delay_seconds: float = 2.0) -> None:
+        self.git_service = git_service
+        self.delay_seconds = delay_seconds
+        self._pending: asyncio.Task[None] | None = None
+        self._commit_lock = asyncio.Lock()
+
+    def mark_dirty(self) -> None:
+        """
+        Request an auto-commit (returns immediately).
+
+        The first call in a window schedules a commit after ``delay_seconds``;
+        further calls before it fires are folded into the same commit.
+        Must be called from within the running event loop.
+        """
+        if not self.git_service.enabled:
+            return
+
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.create_task(self._commit_after_delay())
+
+    async def _commit_after_delay(self) -> None:
+        await asyncio.sleep(self.delay_seconds)
+        # Clear before committing so changes written during the commit
+        # schedule a follow-up window instead of being dropped.
+        self._pending = None
+        await self._commit()
+
+    async def _commit(self) -> None:
+        async with self._commit_lock:
+            await safe_background_task("git_auto_commit", self.git_service.auto_commit_and_push)
+
+    async def stop(self) -> None:
+        """
+        Flush pending changes and wait for any running commit (called on shutdown).
+
+        A pending window is cancelled and committed immediately. A commit whose
+        window already fired holds ``_commit_lock`` while it runs, so taking the
+        lock waits for it to finish.
+        """
+        task = self._pending
+        self._pending = None
+        if task is None or task.done():
+            async with self._commit_lock:
+                return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        logger.info("Flushing pending git auto-commit on shutdown")
+        await self._commit()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -24,6 +25,7 @@ class HealthCheckService:
         vault_service: VaultService,
         git_service: GitService | None = None,
         version: str = "unknown",
+        cache_ttl_seconds: float = 1.0,
     ) -> None:
         """
         Initialize health check service.
@@ -32,10 +34,14 @@ class HealthCheckService:
             vault_service: VaultService instance
             git_service: GitService instance (optional)
             version: Application version string
+            cache_ttl_seconds: How long a non-unhealthy result is reused
         """
         self.vault_service = vault_service
         self.git_service = git_service
         self.version = version
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cached: tuple[float, HealthCheckResponse] | None = None
+        self._check_lock = asyncio.Lock()
 
     async def check_vault_health(self) -> ServiceHealth:
         """
@@ -133,15 +139,46 @@ class HealthCheckService:
                 response_time_ms=elapsed,
             )
 
-    async def check_health(self) -> HealthCheckResponse:
+    async def check_health(self, *, fresh: bool = False) -> HealthCheckResponse:
         """
         Perform complete health check.
 
-        Checks all services in parallel and returns overall status.
+        Results are reused for ``cache_ttl_seconds`` so probe bursts run the
+        checks once; concurrent callers share a single run. Unhealthy results
+        are never cached so recovery shows up on the next probe.
+
+        Args:
+            fresh: Bypass the cached result and run the checks now
 
         Returns:
             HealthCheckResponse with overall status and service details
         """
+        if not fresh and (cached := self._cached_result()) is not None:
+            return cached
+
+        async with self._check_lock:
+            # Another caller may have refreshed the result while we waited
+            if not fresh and (cached := self._cached_result()) is not None:
+                return cached
+
+            health = await self._run_checks()
+            if health.status == HealthStatus.UNHEALTHY:
+                self._cached = None
+            else:
+                self._cached = (time.monotonic(), health)
+            return health
+
+    def _cached_result(self) -> HealthCheckResponse | None:
+        """Return the cached result if it is still within the TTL."""
+        if self._cached is None:
+            return None
+        checked_at, health = self._cached
+        if time.monotonic() - checked_at >= self.cache_ttl_seconds:
+            return None
+        return health
+
+    async def _run_checks(self) -> HealthCheckResponse:
+        """Check all services in parallel and derive the overall status."""
         # Check all services in parallel for efficiency
         vault_health, git_health = await asyncio.gather(
             self.check_vault_health(),
@@ -1,5 +1,6 @@
 import logging
 import subprocess
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -61,20 +62,37 @@ class InboxService:
         Raw text content here...
         ```
         """
+        return "".join(self.format_capture_parts(request, dump_id))
+
+    def format_capture_parts(self, request: CaptureRequest, dump_id: str) -> tuple[str, ...]:
+        """
+        Return the capture file as ordered parts (frontmatter, body, trailing newline).
+
+        The body is ``request.text`` itself, so large captures can be written
+        without first being concatenated into one string.
+        """
         metadata = self._build_metadata(request, dump_id)
         yaml_content = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
 
-        return f"---\n{yaml_content}---\n\n{request.text}\n"
+        return (f"---\n{yaml_content}---\n\n", request.text, "\n")
 
     def write_capture(self, file_path: Path, content: str) -> None:
         """
         Write a capture to its own file.
 
+        Creates the file and parent directories if they don't exist.
+        """
+        self.write_capture_parts(file_path, (content,))
+
+    def write_capture_parts(self, file_path: Path, parts: Iterable[str]) -> None:
+        """
+        Write a capture from ordered parts without joining them in memory.
+
         Creates the file and parent directories if they don't exist.
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.writelines(parts)
 
     def get_unprocessed_dumps(self, vault_path: Path, inbox_folder: str) -> list[dict[str, Any]]:
         """
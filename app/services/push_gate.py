@@ -0,0 +1,119 @@
+"""Per-device rate limiting and duplicate suppression for push sends.
+
+Bursts of identical notifications (retries, repeated API calls) otherwise fan
+out to every device each time and can get the relay throttled. The gate is
+checked in-process before any network I/O, so a suppressed send costs a dict
+lookup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Width of the rolling rate-limit window
+_RATE_WINDOW_SECONDS = 60.0
+
+
+class PushGate:
+    """Decide whether a notification may be sent to a device right now."""
+
+    def __init__(
+        self,
+        max_per_minute: int = 30,
+        dedup_window_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the gate.
+
+        Args:
+            max_per_minute: Sends allowed per device in any 60 second window
+            dedup_window_seconds: Identical notifications to the same device
+                within this window are suppressed (0 disables)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_per_minute = max_per_minute
+        self.dedup_window_seconds = dedup_window_seconds
+        self._clock = clock
+        self._recent_sends: dict[str, deque[float]] = {}
+        self._last_sent: dict[tuple[str, str], float] = {}
+
+    @staticmethod
+    def content_key(title: str, body: str, data: dict[str, Any] | None) -> str:
+        """
+        Fingerprint a notification's content for duplicate detection.
+
+        ``data`` is included so that, for example, completions of different
+        chat sessions with the same title and body are not treated as copies.
+        """
+        content = orjson.dumps([title, body, data], option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+    def check(self, installation_id: str, content_key: str) -> str | None:
+        """
+        Check and reserve a send to one device.
+
+        Allowed sends are recorded immediately, so concurrent callers see
+        them; call ``release()`` if the send then fails.
+
+        Args:
+            installation_id: Target device
+            content_key: Result of ``content_key()`` for the notification
+
+        Returns:
+            None if the send is allowed, otherwise the reason it was suppressed
+        """
+        now = self._clock()
+
+        dedup_key = (installation_id, content_key)
+        last_sent = self._last_sent.get(dedup_key)
+        if last_sent is not None and now - last_sent < self.dedup_window_seconds:
+            return "Duplicate notification suppressed"
+
+        sends = self._recent_sends.setdefault(installation_id, deque())
+        while sends and now - sends[0] >= _RATE_WINDOW_SECONDS:
+            sends.popleft()
+        if len(sends) >= self.max_per_minute:
+            return "Rate limit exceeded"
+
+        sends.append(now)
+        self._prune_dedup(now)
+        self._last_sent[dedup_key] = now
+        return None
+
+    def release(self, installation_id: str, content_key: str) -> None:
+        """
+        Undo the reservation made by ``check()`` for a send that failed.
+
+        Frees the rate-limit slot and forgets the dedup entry so the same
+        notification can be retried right away.
+
+        Args:
+            installation_id: Target device
+            content_key: Content key passed to ``check()``
+        """
+        reserved_at = self._last_sent.pop((installation_id, content_key), None)
+        sends = self._recent_sends.get(installation_id)
+        if reserved_at is None or not sends:
+            return
+        with contextlib.suppress(ValueError):
+            sends.remove(reserved_at)
+
+    def _prune_dedup(self, now: float) -> None:
+        """Drop dedup entries whose window has passed (bounds memory)."""
+        if len(self._last_sent) < 1024:
+            return
+        self._last_sent = {
+            key: sent_at
+            for key, sent_at in self._last_sent.items()
+            if now - sent_at < self.dedup_window_seconds
+        }
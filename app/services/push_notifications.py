@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -10,10 +11,13 @@ import httpx
 
 from app.models.push import DeviceResult
 from app.services import device_registry
+from app.services.push_gate import PushGate
+from app.services.relay_client import encode_push_payload
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from app.services.device_registry import Device
     from app.services.relay_client import PrimePushRelayClient
 
 logger = logging.getLogger(__name__)
@@ -27,14 +31,23 @@ class PushSendSummary:
     failed: int
     invalid_tokens_removed: int
     device_results: list[DeviceResult]
+    suppressed: int = 0
 
 
 class PushNotificationService:
     """Encapsulates device registry lookup and relay delivery."""
 
-    def __init__(self, devices_file: Path, relay_client: PrimePushRelayClient) -> None:
+    def __init__(
+        self,
+        devices_file: Path,
+        relay_client: PrimePushRelayClient,
+        max_concurrent_sends: int = 10,
+        gate: PushGate | None = None,
+    ) -> None:
         self.devices_file = devices_file
         self.relay_client = relay_client
+        self.max_concurrent_sends = max_concurrent_sends
+        self.gate = gate
 
     async def send_notification(
         self,
@@ -73,73 +86,34 @@ class PushNotificationService:
                 device_results=[],
             )
 
-        sent = 0
-        failed = 0
-        invalid_tokens_removed = 0
-        device_results: list[DeviceResult] = []
-
-        for device in devices:
-            device_name = device.device_name or device.device_type
-
-            try:
-                queued = await self.relay_client.send_push(
-                    push_url=device.push_url,
-                    title=title,
-                    body=body,
-                    data=data,
+        # Send to all devices concurrently; the semaphore caps open relay requests
+        semaphore = asyncio.Semaphore(self.max_concurrent_sends)
+        content_key = PushGate.content_key(title, body, data) if self.gate else ""
+        # Same request body for every device; encode it once
+        payload = encode_push_payload(title, body, data)
+        stale_ids: set[str] = set()
+        device_results = list(
+            await asyncio.gather(
+                *(
+                    self._send_to_device(
+                        device,
+                        semaphore,
+                        content_key,
+                        stale_ids,
+                        payload=payload,
+                    )
+                    for device in devices
                 )
+            )
+        )
 
-                if queued:
-                    sent += 1
-                    device_results.append(DeviceResult(name=device_name, status="sent", error=None))
-                else:
-                    failed += 1
-                    device_results.append(
-                        DeviceResult(name=device_name, status="failed", error="Not queued")
-                    )
+        # Drop every dead binding with a single registry rewrite
+        await device_registry.remove_devices(self.devices_file, stale_ids)
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 410:
-                    await device_registry.remove_device(
-                        self.devices_file,
-                        device.installation_id,
-                    )
-                    invalid_tokens_removed += 1
-                    device_results.append(
-                        DeviceResult(
-                            name=device_name,
-                            status="invalid_binding",
-                            error="Binding no longer valid (removed)",
-                        )
-                    )
-                    logger.info(
-                        "Device removed due to invalid binding",
-                        extra={"installation_id": device.installation_id},
-                    )
-                else:
-                    failed += 1
-                    device_results.append(
-                        DeviceResult(name=device_name, status="failed", error=str(e))
-                    )
-                    logger.error(
-                        "Failed to send to device",
-                        extra={
-                            "installation_id": device.installation_id,
-                            "status_code": e.response.status_code,
-                            "error_type": type(e).__name__,
-                        },
-                    )
-
-            except Exception as e:
-                failed += 1
-                device_results.append(DeviceResult(name=device_name, status="failed", error=str(e)))
-                logger.exception(
-                    "Failed to send to device",
-                    extra={
-                        "installation_id": device.installation_id,
-                        "error_type": type(e).__name__,
-                    },
-                )
+        sent = sum(1 for r in device_results if r.status == "sent")
+        invalid_tokens_removed = sum(1 for r in device_results if r.status == "invalid_binding")
+        suppressed = sum(1 for r in device_results if r.status == "suppressed")
+        failed = len(device_results) - sent - invalid_tokens_removed - suppressed
 
         logger.info(
             "Push notification send completed",
@@ -147,6 +121,7 @@ class PushNotificationService:
                 "sent": sent,
                 "failed": failed,
                 "invalid_tokens_removed": invalid_tokens_removed,
+                "suppressed": suppressed,
             },
         )
 
@@ -155,4 +130,94 @@ class PushNotificationService:
             failed=failed,
             invalid_tokens_removed=invalid_tokens_removed,
             device_results=device_results,
+            suppressed=suppressed,
         )
+
+    async def _send_to_device(
+        self,
+        device: Device,
+        semaphore: asyncio.Semaphore,
+        content_key: str,
+        stale_ids: set[str],
+        *,
+        payload: bytes,
+    ) -> DeviceResult:
+        """
+        Send a notification to one device and report the outcome.
+
+        Sends held back by the gate are reported as suppressed without any
+        network I/O. A send that does not go through gives its gate slot
+        back, so retrying it is not treated as a duplicate.
+        """
+        if self.gate is None:
+            return await self._deliver(device, semaphore, stale_ids, payload=payload)
+
+        reason = self.gate.check(device.installation_id, content_key)
+        if reason is not None:
+            device_name = device.device_name or device.device_type
+            return DeviceResult(name=device_name, status="suppressed", error=reason)
+
+        result = await self._deliver(device, semaphore, stale_ids, payload=payload)
+        if result.status != "sent":
+            self.gate.release(device.installation_id, content_key)
+        return result
+
+    async def _deliver(
+        self,
+        device: Device,
+        semaphore: asyncio.Semaphore,
+        stale_ids: set[str],
+        *,
+        payload: bytes,
+    ) -> DeviceResult:
+        """
+        Post the notification to one device through the relay.
+
+        Devices whose binding is gone (410) are added to ``stale_ids`` so the
+        caller can remove them in one registry write.
+        """
+        device_name = device.device_name or device.device_type
+
+        try:
+            async with semaphore:
+                queued = await self.relay_client.send_encoded_push(
+                    push_url=device.push_url,
+                    payload=payload,
+                )
+
+            if queued:
+                return DeviceResult(name=device_name, status="sent", error=None)
+            return DeviceResult(name=device_name, status="failed", error="Not queued")
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 410:
+                stale_ids.add(device.installation_id)
+                logger.info(
+                    "Removing device due to invalid binding",
+                    extra={"installation_id": device.installation_id},
+                )
+                return DeviceResult(
+                    name=device_name,
+                    status="invalid_binding",
+                    error="Binding no longer valid (removed)",
+                )
+
+            logger.error(
+                "Failed to send to device",
+                extra={
+                    "installation_id": device.installation_id,
+                    "status_code": e.response.status_code,
+                    "error_type": type(e).__name__,
+                },
+            )
+            return DeviceResult(name=device_name, status="failed", error=str(e))
+
+        except Exception as e:
+            logger.exception(
+                "Failed to send to device",
+                extra={
+                    "installation_id": device.installation_id,
+                    "error_type": type(e).__name__,
+                },
+            )
+            return DeviceResult(name=device_name, status="failed", error=str(e))
@@ -19,6 +19,22 @@ class PushPayload(BaseModel):
     data: dict[str, Any] | None = None
 
 
+def encode_push_payload(title: str, body: str, data: dict[str, Any] | None = None) -> bytes:
+    """
+    Serialize a notification into the relay's JSON request body.
+
+    Args:
+        title: Notification title
+        body: Notification body
+        data: Optional custom data dict
+
+    Returns:
+        JSON bytes with unset fields omitted
+    """
+    payload = PushPayload(title=title, body=body, data=data)
+    return payload.model_dump_json(exclude_none=True).encode("utf-8")
+
+
 class PrimePushRelayClient:
     """Client for sending push notifications via capability URLs."""
 
@@ -30,6 +46,24 @@ class PrimePushRelayClient:
             timeout_seconds: Timeout for HTTP requests in seconds
         """
         self.timeout = timeout_seconds
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps relay connections alive between sends
+        instead of paying a TCP + TLS handshake per notification.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called on shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_push(
         self,
@@ -53,8 +87,25 @@ class PrimePushRelayClient:
         Raises:
             httpx.HTTPError: If the request fails
         """
-        payload = PushPayload(title=title, body=body, data=data)
+        return await self.send_encoded_push(push_url, encode_push_payload(title, body, data))
+
+    async def send_encoded_push(self, push_url: str, payload: bytes) -> bool:
+        """
+        Send an already serialized notification via capability URL.
+
+        Lets a fan-out encode the payload once with ``encode_push_payload``
+        and reuse the bytes for every device.
+
+        Args:
+            push_url: Capability URL (contains push_id and push_secret)
+            payload: JSON body from ``encode_push_payload``
 
+        Returns:
+            True if notification was successfully queued
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
         # Extract push_id for logging (NEVER log push_secret)
         push_id = "unknown"
         try:
@@ -65,29 +116,27 @@ class PrimePushRelayClient:
         except Exception:
             pass  # Use default "unknown" if parsing fails
 
-        logger.debug(
-            "Sending push notification",
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sending push notification",
+                extra={"push_id": push_id},
+            )
+
+        response = await self._get_client().post(
+            push_url,
+            content=payload,
+            headers={"Content-Type": "application/json"},
+        )
+
+        logger.info(
+            "Push notification sent",
             extra={
                 "push_id": push_id,
-                "title": title,
+                "status_code": response.status_code,
             },
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                push_url,
-                json=payload.model_dump(exclude_none=True),
-            )
-
-            logger.info(
-                "Push notification sent",
-                extra={
-                    "push_id": push_id,
-                    "status_code": response.status_code,
-                },
-            )
-
-            response.raise_for_status()
+        response.raise_for_status()
 
-            result = response.json()
-            return bool(result.get("queued", False))
+        result = response.json()
+        return bool(result.get("queued", False))
@@ -1,4 +1,6 @@
+import functools
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -12,10 +14,16 @@ class VaultService:
 
     def __init__(self, vault_path: str):
         self.vault_path = Path(vault_path)
+        self._vault_root_prefix = str(self.vault_path).rstrip(os.sep) + os.sep
         self._vault_config: VaultConfig | None = None
         self._config_file_path = Path(vault_path) / ".prime" / "settings.yaml"
         self._last_mtime: float | None = None
 
+    @functools.cached_property
+    def resolved_vault_path(self) -> Path:
+        """Vault root with symlinks resolved (resolved once per service)."""
+        return self.vault_path.resolve()
+
     @property
     def vault_config(self) -> VaultConfig:
         """
@@ -179,4 +187,9 @@ class VaultService:
 
     def get_relative_path(self, absolute_path: Path) -> str:
         """Return path relative to vault root."""
+        path_str = str(absolute_path)
+        if path_str.startswith(self._vault_root_prefix):
+            return path_str[len(self._vault_root_prefix) :]
+        # Not a plain child of the root string (e.g. the root itself): defer to pathlib,
+        # which raises ValueError for paths outside the vault
         return str(absolute_path.relative_to(self.vault_path))
@@ -5,6 +5,9 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+# Safe alphanumeric session IDs (up to 255 chars), including UUIDs
+_SAFE_SESSION_ID_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+
 
 class PathValidationError(ValueError):
     """Raised when path validation fails."""
@@ -235,14 +238,9 @@ def validate_session_id(session_id: str) -> str:
         msg = "Session ID contains invalid path characters"
         raise PathValidationError(msg)
 
-    # Allow UUID format or alphanumeric + hyphens/underscores
-    # Pattern: UUID format (36 chars) or safe alphanumeric (up to 255 chars)
-    uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-    safe_id_pattern = r"^[a-zA-Z0-9._-]+$"
-
-    if not (
-        re.match(uuid_pattern, session_id, re.IGNORECASE) or re.match(safe_id_pattern, session_id)
-    ):
+    # Allow UUID format or alphanumeric + hyphens/underscores (UUIDs are a
+    # subset of the safe pattern, so one precompiled match covers both)
+    if not _SAFE_SESSION_ID_RE.match(session_id):
         msg = "Session ID must be UUID format or contain only alphanumeric characters, hyphens, underscores, and dots"
         raise PathValidationError(msg)
 
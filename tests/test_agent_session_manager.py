@@ -136,6 +136,29 @@ async def test_get_running_session_ids(session_manager, mock_agent_service, mock
     assert "running-session" not in running_ids_after
 
 
+@pytest.mark.asyncio
+async def test_get_status_snapshot(session_manager, mock_agent_service, mock_client):
+    """Test status snapshot captures state fields and derived status."""
+    mock_agent_service.create_client_instance.return_value = mock_client
+
+    state = await session_manager.get_or_create_session("snapshot-session")
+    state.is_processing = True
+    state.last_event_type = "text"
+    state.completed_at = None
+
+    snapshot = await session_manager.get_status_snapshot(state)
+
+    assert snapshot.is_processing is True
+    assert snapshot.waiting_for_user is False
+    assert snapshot.pending_question_id is None
+    assert snapshot.status == "generating"
+    assert snapshot.last_event_type == "text"
+    assert snapshot.last_activity == state.last_activity.isoformat()
+    assert snapshot.completed_at is None
+
+    await session_manager.terminate_session("snapshot-session")
+
+
 @pytest.mark.asyncio
 async def test_pending_session_ids_are_unique(session_manager, mock_agent_service, mock_client):
     """Test that new sessions use unique pending IDs."""
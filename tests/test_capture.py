@@ -152,3 +152,30 @@ def test_capture_different_app_contexts(client, auth_headers):
             headers=auth_headers,
         )
         assert response.status_code == 200
+
+
+def test_capture_writes_file_off_event_loop_thread(client, auth_headers, sample_capture_request):
+    """Capture file write runs in a worker thread, not on the event loop thread."""
+    import threading
+
+    from app.services.container import get_container
+
+    inbox_service = get_container().inbox_service
+    original_write = inbox_service.write_capture_parts
+    write_threads: list[threading.Thread] = []
+
+    def tracking_write(file_path, parts):
+        write_threads.append(threading.current_thread())
+        original_write(file_path, parts)
+
+    inbox_service.write_capture_parts = tracking_write
+
+    response = client.post(
+        "/api/v1/capture",
+        json=sample_capture_request,
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert len(write_threads) == 1
+    assert write_threads[0].name.startswith("asyncio")
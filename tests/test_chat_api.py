@@ -1,14 +1,16 @@
 """Tests for chat API websocket contract and history validation."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 from types import SimpleNamespace
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api import chat
 from app.dependencies import get_agent_session_manager, get_chat_session_manager
-from app.services.agent_session_manager import AgentSessionManager
+from app.services.agent_session_manager import AgentSessionManager, SessionStatusSnapshot
 
 
 class _NullAsyncLock:
@@ -44,6 +46,57 @@ def test_session_messages_invalid_id_returns_400():
     assert "Invalid session ID" in response.json()["detail"]
 
 
+def test_session_messages_missing_session_returns_404():
+    mock_chat_session_manager = MagicMock()
+    mock_chat_session_manager.get_session_messages.return_value = None
+
+    with _build_chat_client(MagicMock(), mock_chat_session_manager) as client:
+        response = client.get("/api/v1/chat/sessions/abc1234/messages")
+
+    assert response.status_code == 404
+    mock_chat_session_manager.session_exists.assert_not_called()
+
+
+def test_session_messages_filters_empty_and_serializes_timestamps():
+    mock_chat_session_manager = MagicMock()
+    mock_chat_session_manager.get_session_messages.return_value = [
+        {"role": "user", "content": "Hello", "timestamp": "2026-01-01T00:00:00.500000+00:00"},
+        {"role": "assistant", "content": "   ", "timestamp": "2026-01-01T00:00:01+00:00"},
+        {
+            "role": "assistant",
+            "content": "",
+            "timestamp": "2026-01-01T00:00:02+00:00",
+            "tool_name": "Read",
+            "tool_input": {"file_path": "notes.md"},
+        },
+    ]
+
+    with _build_chat_client(MagicMock(), mock_chat_session_manager) as client:
+        response = client.get("/api/v1/chat/sessions/abc1234/messages")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "session_id": "abc1234",
+        "messages": [
+            {
+                "role": "user",
+                "content": "Hello",
+                "timestamp": "2026-01-01T00:00:00.500000Z",
+                "tool_name": None,
+                "tool_input": None,
+            },
+            {
+                "role": "assistant",
+                "content": "",
+                "timestamp": "2026-01-01T00:00:02Z",
+                "tool_name": "Read",
+                "tool_input": {"file_path": "notes.md"},
+            },
+        ],
+        "message_count": 2,
+    }
+
+
 def test_websocket_connected_session_id_and_complete():
     mock_agent_service = MagicMock()
     mock_client = AsyncMock()
@@ -237,7 +290,17 @@ def test_websocket_resume_accepts_in_memory_session():
             pending_question_id=None,
         )
     )
-    agent_session_manager.get_activity_status = MagicMock(return_value="waiting")
+    agent_session_manager.get_status_snapshot = AsyncMock(
+        return_value=SessionStatusSnapshot(
+            is_processing=False,
+            waiting_for_user=False,
+            pending_question_id=None,
+            status="waiting",
+            last_event_type=None,
+            last_activity=None,
+            completed_at=None,
+        )
+    )
     agent_session_manager.attach_websocket = AsyncMock(return_value=[])
     agent_session_manager.finish_replay = AsyncMock()
     agent_session_manager.detach_websocket = AsyncMock()
@@ -253,3 +316,159 @@ def test_websocket_resume_accepts_in_memory_session():
             assert status_event["waiting_for_user"] is False
             assert status_event["pending_question_id"] is None
             assert status_event["status"] == "waiting"
+
+
+def _build_replay_agent_session_manager(buffered):
+    agent_session_manager = MagicMock()
+    agent_session_manager.has_session.return_value = True
+    agent_session_manager.get_or_create_session = AsyncMock(
+        return_value=SimpleNamespace(
+            session_id="session-123",
+            ws_lock=_NullAsyncLock(),
+            last_activity=None,
+            completed_at=None,
+            last_event_type="text",
+            is_processing=True,
+            waiting_for_user=False,
+            pending_question_id=None,
+        )
+    )
+    agent_session_manager.get_status_snapshot = AsyncMock(
+        return_value=SessionStatusSnapshot(
+            is_processing=True,
+            waiting_for_user=False,
+            pending_question_id=None,
+            status="generating",
+            last_event_type="text",
+            last_activity=None,
+            completed_at=None,
+        )
+    )
+    agent_session_manager.attach_websocket = AsyncMock(return_value=buffered)
+    agent_session_manager.finish_replay = AsyncMock()
+    agent_session_manager.detach_websocket = AsyncMock()
+    return agent_session_manager
+
+
+def test_websocket_replay_batch_opt_in_packs_buffered_events(monkeypatch):
+    mock_chat_session_manager = MagicMock()
+    mock_chat_session_manager.session_exists.return_value = False
+    buffered = [{"type": "text", "chunk": str(i)} for i in range(5)]
+    agent_session_manager = _build_replay_agent_session_manager(buffered)
+    monkeypatch.setattr(chat, "REPLAY_BATCH_SIZE", 3)
+
+    chat.connection_manager.active_connections.clear()
+    with _build_chat_client(agent_session_manager, mock_chat_session_manager) as client:
+        with client.websocket_connect("/api/v1/chat/ws/session-123?replay_batch=true") as ws:
+            ws.receive_json()  # connected
+            status_event = ws.receive_json()
+            assert status_event["buffered_count"] == 5
+            first_batch = ws.receive_json()
+            second_batch = ws.receive_json()
+
+    assert first_batch == {"type": "replay_batch", "messages": buffered[:3]}
+    assert second_batch == {"type": "replay_batch", "messages": buffered[3:]}
+
+
+def test_websocket_replay_without_opt_in_sends_individual_events():
+    mock_chat_session_manager = MagicMock()
+    mock_chat_session_manager.session_exists.return_value = False
+    buffered = [{"type": "text", "chunk": "a"}, {"type": "text", "chunk": "b"}]
+    agent_session_manager = _build_replay_agent_session_manager(buffered)
+
+    chat.connection_manager.active_connections.clear()
+    with _build_chat_client(agent_session_manager, mock_chat_session_manager) as client:
+        with client.websocket_connect("/api/v1/chat/ws/session-123") as ws:
+            ws.receive_json()  # connected
+            ws.receive_json()  # session_status
+            replayed = [ws.receive_json(), ws.receive_json()]
+
+    assert replayed == buffered
+
+
+async def test_connection_manager_sends_compact_json_text_frame():
+    manager = chat.ConnectionManager()
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock()
+    manager.active_connections["conn_1"] = websocket
+
+    sent = await manager.send_message("conn_1", {"type": "text", "chunk": "héllo"})
+
+    assert sent is True
+    websocket.send_text.assert_awaited_once_with('{"type":"text","chunk":"héllo"}')
+
+
+async def test_connection_manager_connect_rejects_duplicate_during_handshake():
+    manager = chat.ConnectionManager()
+    accept_started = asyncio.Event()
+    release_accept = asyncio.Event()
+
+    async def _slow_accept():
+        accept_started.set()
+        await release_accept.wait()
+
+    first = MagicMock()
+    first.accept = AsyncMock(side_effect=_slow_accept)
+    duplicate = MagicMock()
+    duplicate.close = AsyncMock()
+    other = MagicMock()
+    other.accept = AsyncMock()
+
+    first_connect = asyncio.create_task(manager.connect("conn_1", first))
+    await accept_started.wait()
+
+    # Another ID connects while the first handshake is still pending
+    assert await manager.connect("conn_2", other) is True
+    assert await manager.connect("conn_1", duplicate) is False
+    duplicate.close.assert_awaited_once()
+
+    release_accept.set()
+    assert await first_connect is True
+    assert manager.active_connections == {"conn_1": first, "conn_2": other}
+
+
+async def test_connection_manager_connect_releases_id_when_accept_fails():
+    manager = chat.ConnectionManager()
+    websocket = MagicMock()
+    websocket.accept = AsyncMock(side_effect=RuntimeError("handshake failed"))
+
+    with pytest.raises(RuntimeError):
+        await manager.connect("conn_1", websocket)
+
+    assert "conn_1" not in manager.active_connections
+
+
+async def test_connection_manager_send_failure_drops_connection_and_closes():
+    manager = chat.ConnectionManager()
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock(side_effect=RuntimeError("broken pipe"))
+    websocket.close = AsyncMock()
+    manager.active_connections["conn_1"] = websocket
+
+    sent = await manager.send_message("conn_1", {"type": "text", "chunk": "x"})
+
+    assert sent is False
+    assert "conn_1" not in manager.active_connections
+    await asyncio.gather(*manager._close_tasks)
+    websocket.close.assert_awaited_once()
+
+
+async def test_connection_manager_send_timeout_drops_slow_client(monkeypatch):
+    manager = chat.ConnectionManager()
+    monkeypatch.setattr(manager, "SEND_TIMEOUT_SECONDS", 0.01)
+
+    async def _stalled_send(_text):
+        await asyncio.sleep(10)
+
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock(side_effect=_stalled_send)
+    websocket.close = AsyncMock()
+    manager.active_connections["conn_1"] = websocket
+
+    sent = await manager.send_message("conn_1", {"type": "text", "chunk": "x"})
+
+    assert sent is False
+    assert "conn_1" not in manager.active_connections
+    await asyncio.gather(*manager._close_tasks)
+    websocket.close.assert_awaited_once()
+    assert websocket.close.await_args.kwargs["code"] == 1013
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -100,3 +101,26 @@ async def test_title_exists(tmp_path: Path) -> None:
 
     assert await service.title_exists("session-1") is True
     assert await service.title_exists("session-2") is False
+
+
+@pytest.mark.asyncio
+async def test_get_titles_reuses_parsed_store_until_file_changes(tmp_path: Path) -> None:
+    titles_file = tmp_path / "chat" / "titles.json"
+    service = ChatTitleService(titles_file)
+
+    await service.set_title(
+        "session-1",
+        "My Title",
+        "2026-01-01T00:00:00Z",
+        source="generated",
+    )
+
+    with patch("app.services.chat_titles.json.load", side_effect=AssertionError("reparsed")):
+        assert await service.get_titles(["session-1"]) == {"session-1": "My Title"}
+
+    # An external edit to the file is picked up on the next read
+    data = json.loads(titles_file.read_text())
+    data["titles"]["session-1"]["title"] = "Edited Title Outside"
+    titles_file.write_text(json.dumps(data))
+
+    assert await service.get_title("session-1") == "Edited Title Outside"
@@ -210,6 +210,28 @@ def test_get_session_summary(
     assert "messages" not in summary
 
 
+def test_session_exists_and_summary_match_listing(
+    temp_project_path: Path,
+    temp_claude_home: Path,
+    sessions_dir: Path,
+):
+    """Test single-session lookups agree with the full listing."""
+    create_test_session(sessions_dir, "session-1", "First session")
+    create_test_session(sessions_dir, "agent-abc1234", "Agent session")
+
+    api = ClaudeSessionAPI(temp_project_path, temp_claude_home)
+
+    assert api.session_exists("session-1") is True
+    assert api.session_exists("agent-abc1234") is True
+    assert api.session_exists("missing") is False
+    assert api.get_session_summary("missing") is None
+    assert api.get_session_messages("missing") is None
+
+    listing = {s["session_id"]: s for s in api.list_sessions(include_agent_sessions=True)}
+    assert api.get_session_summary("session-1") == listing["session-1"]
+    assert api.get_session_summary("agent-abc1234") == listing["agent-abc1234"]
+
+
 def test_search_sessions(
     temp_project_path: Path,
     temp_claude_home: Path,
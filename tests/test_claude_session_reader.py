@@ -1,6 +1,7 @@
 """Tests for Claude Code session reader."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -93,6 +94,98 @@ def test_list_sessions_with_regular_session(
     assert session["last_activity"] is not None
 
 
+def test_list_sessions_reuses_metadata_for_unchanged_files(
+    temp_project_path: Path,
+    temp_claude_home: Path,
+    sessions_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that listings only re-read session files that changed."""
+    user_message = {
+        "type": "user",
+        "uuid": "msg-1",
+        "timestamp": "2025-12-28T10:00:00.000Z",
+        "message": {"role": "user", "content": "Hello"},
+    }
+    session_file = create_test_session(sessions_dir, "session-1", [user_message])
+    stale_file = create_test_session(sessions_dir, "session-2", [user_message])
+
+    reader = ClaudeSessionReader(temp_project_path, temp_claude_home)
+    assert len(reader.list_sessions()) == 2
+
+    reads: list[str] = []
+    read_metadata = reader._read_session_metadata
+
+    def _tracking_read(jsonl_file: Path) -> dict:
+        reads.append(jsonl_file.stem)
+        return read_metadata(jsonl_file)
+
+    monkeypatch.setattr(reader, "_read_session_metadata", _tracking_read)
+
+    assert len(reader.list_sessions()) == 2
+    assert reads == []
+
+    with session_file.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({**user_message, "timestamp": "2025-12-28T11:00:00.000Z"}) + "\n")
+    stale_file.unlink()
+
+    sessions = reader.list_sessions()
+
+    assert reads == ["session-1"]
+    assert [s["session_id"] for s in sessions] == ["session-1"]
+    assert sessions[0]["message_count"] == 2
+    assert stale_file not in reader._metadata_cache
+
+
+def test_list_sessions_concurrent_threads_share_cache(
+    temp_project_path: Path,
+    temp_claude_home: Path,
+    sessions_dir: Path,
+):
+    """Test that listings from several worker threads can share the cache."""
+    user_message = {
+        "type": "user",
+        "uuid": "msg-1",
+        "timestamp": "2025-12-28T10:00:00.000Z",
+        "message": {"role": "user", "content": "Hello"},
+    }
+    for i in range(50):
+        create_test_session(sessions_dir, f"session-{i}", [user_message])
+
+    reader = ClaudeSessionReader(temp_project_path, temp_claude_home)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: len(reader.list_sessions()), range(32)))
+
+    assert results == [50] * 32
+    assert len(reader._metadata_cache) == 50
+
+
+def test_list_sessions_keeps_entries_cached_by_other_listings(
+    temp_project_path: Path,
+    temp_claude_home: Path,
+    sessions_dir: Path,
+):
+    """Test that pruning only forgets files that no longer exist."""
+    user_message = {
+        "type": "user",
+        "uuid": "msg-1",
+        "timestamp": "2025-12-28T10:00:00.000Z",
+        "message": {"role": "user", "content": "Hello"},
+    }
+    create_test_session(sessions_dir, "session-1", [user_message])
+    reader = ClaudeSessionReader(temp_project_path, temp_claude_home)
+
+    # A file cached by a concurrent listing that this scan did not see
+    newer_file = sessions_dir / "session-2.jsonl.partial"
+    newer_file.touch()
+    reader._metadata_cache[newer_file] = ((0, 0), {})
+
+    reader.list_sessions()
+
+    assert newer_file in reader._metadata_cache
+
+
 def test_list_sessions_with_agent_session(
     temp_project_path: Path,
     temp_claude_home: Path,
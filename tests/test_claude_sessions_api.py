@@ -283,3 +283,71 @@ def test_list_sessions_uses_stored_title(
     titles = {session["session_id"]: session["title"] for session in payload["sessions"]}
     assert titles["session-2"] == "Stored Title"
     assert titles["session-1"] == "Session 1"
+
+
+def test_stream_session_messages_ndjson(
+    client: TestClient,
+    sessions_dir: Path,
+) -> None:
+    create_test_session(
+        sessions_dir,
+        "session-0",
+        "Session 0",
+        "2025-12-28T10:00:00.000Z",
+    )
+
+    response = client.get("/api/v1/claude-sessions/session-0/messages.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    expected = client.get("/api/v1/claude-sessions/session-0/messages").json()["messages"]
+    assert lines == expected
+    assert [line["content"] for line in lines] == ["Test message"]
+
+
+def test_stream_session_messages_ndjson_missing_session(client: TestClient) -> None:
+    response = client.get("/api/v1/claude-sessions/abc1234/messages.ndjson")
+    assert response.status_code == 404
+
+
+def test_get_session_and_summary_honor_if_none_match(
+    client: TestClient,
+    sessions_dir: Path,
+) -> None:
+    create_test_session(
+        sessions_dir,
+        "session-0",
+        "Session 0",
+        "2025-12-28T10:00:00.000Z",
+    )
+
+    for url in (
+        "/api/v1/claude-sessions/session-0",
+        "/api/v1/claude-sessions/session-0/summary",
+    ):
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+
+    # Appending a message changes the log, so clients get a fresh body
+    with (sessions_dir / "session-0.jsonl").open("a", encoding="utf-8") as f:
+        f.write(
+            json.dumps(
+                {
+                    "type": "assistant",
+                    "uuid": "session-0-reply",
+                    "timestamp": "2025-12-28T10:01:00.000Z",
+                    "message": {"role": "assistant", "content": "Reply"},
+                }
+            )
+            + "\n"
+        )
+
+    response = client.get("/api/v1/claude-sessions/session-0", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["message_count"] == 2
@@ -12,6 +12,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -115,6 +116,59 @@ def test_list_commands_nested_namespaces(temp_vault: Path) -> None:
     assert cmd.namespace == "backend:api"
 
 
+def test_get_command_by_name_matches_bare_and_namespaced(temp_vault: Path) -> None:
+    """Test lookup by bare name and by namespaced name."""
+    commands_dir = temp_vault / ".claude" / "commands"
+    nested_dir = commands_dir / "backend" / "api"
+    nested_dir.mkdir(parents=True)
+    (commands_dir / "daily.md").write_text("# Daily\nDaily review")
+    (nested_dir / "endpoint.md").write_text("# Endpoint\nCreate an endpoint")
+
+    service = CommandService(str(temp_vault))
+
+    assert service.get_command_by_name("daily").name == "daily"
+    assert service.get_command_by_name("endpoint").namespace == "backend:api"
+    assert service.get_command_by_name("backend:api:endpoint").name == "endpoint"
+    assert service.get_command_by_name("api:endpoint") is None
+    assert service.get_command_by_name("None:daily") is None
+    assert service.get_command_by_name("missing") is None
+
+
+def test_list_commands_reuses_scan_until_directory_changes(
+    temp_vault: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that unchanged command directories are not re-parsed."""
+    commands_dir = temp_vault / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "cmd1.md").write_text("# Command 1\nFirst command")
+
+    service = CommandService(str(temp_vault))
+    first = service.list_commands()
+    _, first_etag = service.list_commands_json()
+
+    scans = 0
+    scan_commands = service._scan_commands
+
+    def _counting_scan():
+        nonlocal scans
+        scans += 1
+        return scan_commands()
+
+    monkeypatch.setattr(service, "_scan_commands", _counting_scan)
+
+    assert service.list_commands() is first
+    assert service.get_command_by_name("cmd1") is not None
+    assert scans == 0
+
+    (commands_dir / "cmd2.md").write_text("# Command 2\nSecond command")
+    second = service.list_commands()
+    _, second_etag = service.list_commands_json()
+
+    assert scans == 1
+    assert second.total == 2
+    assert second_etag != first_etag
+
+
 def test_list_commands_multiple_files(temp_vault: Path) -> None:
     """Test listing multiple command files."""
     commands_dir = temp_vault / ".claude" / "commands"
@@ -402,3 +456,18 @@ This command should not be invoked by SlashCommand tool.
     assert detail is not None
     assert detail.frontmatter is not None
     assert detail.frontmatter.disable_model_invocation is True
+
+
+def test_list_commands_json_matches_listing(temp_vault: Path) -> None:
+    """Test that the pre-serialized listing matches the model and its ETag."""
+    commands_dir = temp_vault / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "cmd1.md").write_text("# Command 1\nFirst command")
+
+    service = CommandService(str(temp_vault))
+    body, etag = service.list_commands_json()
+    listing = service.list_commands()
+
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert json.loads(body) == listing.model_dump(mode="json", by_alias=False)
@@ -97,6 +97,7 @@ def mock_container(
     )
     container.git_service = MagicMock()
     container.git_service.enabled = False
+    container.chat_title_service = AsyncMock()
     return container
 
 
@@ -480,6 +481,10 @@ async def test_trigger_command_with_failed_agent() -> None:
     container.command_service = command_service
     container.agent_service = mock_agent
     container.command_run_manager = manager
+    container.chat_title_service = AsyncMock()
+    container.git_service = MagicMock()
+    container.log_service = MagicMock()
+    container.vault_service = MagicMock()
 
     from app.services import container as container_module
 
@@ -545,3 +550,62 @@ async def test_active_run_count() -> None:
 
     count = await manager.get_active_run_count()
     assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_command_run_manager_long_poll_wakes_on_event() -> None:
+    """Long-poll returns as soon as a new event is appended."""
+    manager = CommandRunManager()
+    run_id = await manager.create_run("test")
+
+    poll = asyncio.create_task(manager.get_run_status(run_id, after_event_id=-1, wait_seconds=5))
+    await asyncio.sleep(0.05)
+    assert not poll.done()
+
+    await manager.append_event(run_id, "text", {"chunk": "hi"})
+    status = await asyncio.wait_for(poll, timeout=1)
+
+    assert [e["chunk"] for e in status["events"]] == ["hi"]
+
+
+@pytest.mark.asyncio
+async def test_command_run_manager_long_poll_times_out_and_skips_finished_runs() -> None:
+    """Long-poll returns empty after the timeout and never waits on finished runs."""
+    manager = CommandRunManager()
+    run_id = await manager.create_run("test")
+
+    status = await manager.get_run_status(run_id, after_event_id=-1, wait_seconds=0.05)
+    assert status["events"] == []
+
+    await manager.update_status(run_id, RunStatus.COMPLETED)
+    status = await asyncio.wait_for(
+        manager.get_run_status(run_id, after_event_id=-1, wait_seconds=5), timeout=1
+    )
+    assert status["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_command_run_manager_append_event_does_not_wait_for_lock() -> None:
+    """Streaming events are buffered without contending on the manager lock."""
+    manager = CommandRunManager()
+    run_id = await manager.create_run("test")
+
+    async with manager._lock:
+        await asyncio.wait_for(manager.append_event(run_id, "text", {"chunk": "a"}), timeout=1)
+
+    status = await manager.get_run_status(run_id)
+    assert [e["chunk"] for e in status["events"]] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_command_run_manager_reuses_event_payloads() -> None:
+    """Repeated status reads share the flattened event dicts."""
+    manager = CommandRunManager()
+    run_id = await manager.create_run("test")
+    await manager.append_event(run_id, "text", {"chunk": "a"})
+
+    first = await manager.get_run_status(run_id)
+    second = await manager.get_run_status(run_id)
+
+    assert first["events"] == [{"event_id": 0, "type": "text", "chunk": "a"}]
+    assert second["events"][0] is first["events"][0]
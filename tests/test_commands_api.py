@@ -87,6 +87,33 @@ def test_list_commands_empty(client_with_commands: TestClient, temp_vault: Path)
     assert len(data["commands"]) == 0
 
 
+def test_list_commands_honors_if_none_match(
+    client_with_commands: TestClient, temp_vault: Path
+) -> None:
+    """Test that an unchanged listing is answered with 304."""
+    commands_dir = temp_vault / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "daily.md").write_text("# Daily\nDaily review")
+    headers = {"Authorization": "Bearer test-token-123"}
+
+    response = client_with_commands.get("/api/v1/commands", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    cached = client_with_commands.get(
+        "/api/v1/commands", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    (commands_dir / "weekly.md").write_text("# Weekly\nWeekly review")
+    refreshed = client_with_commands.get(
+        "/api/v1/commands", headers={**headers, "If-None-Match": etag}
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.json()["total"] == 2
+
+
 def test_list_commands_with_data(client_with_commands: TestClient, temp_vault: Path) -> None:
     """Test listing commands with actual command files."""
     # Create command files
@@ -5,15 +5,18 @@ from pathlib import Path
 
 import pytest
 
+from app.services import device_registry
 from app.services.device_registry import (
     Device,
     DeviceRegistry,
     add_or_update_device,
     get_device,
+    get_safe_snapshot,
     init_file_lock,
     list_devices,
     load_devices,
     remove_device,
+    remove_devices,
     sanitize_device_name,
     save_devices,
 )
@@ -407,6 +410,48 @@ class TestRemoveDevice:
         assert data["devices"][0]["installation_id"] == id2
 
 
+class TestRemoveDevices:
+    """Test bulk device removal."""
+
+    @pytest.mark.asyncio
+    async def test_remove_several_devices_in_one_write(self, tmp_path: Path, monkeypatch):
+        """Matching devices are removed with a single save; unknown ids are ignored."""
+        devices_file = tmp_path / "devices.json"
+        ids = [f"550e8400-e29b-41d4-a716-44665544002{i}" for i in range(3)]
+        for i, installation_id in enumerate(ids):
+            await add_or_update_device(
+                devices_file=devices_file,
+                installation_id=installation_id,
+                device_name=f"device{i}",
+                device_type="iphone",
+                push_url=f"https://example.com/push/device{i}",
+            )
+
+        saves = []
+        real_save = device_registry.save_devices
+
+        def counting_save(path: Path, registry: DeviceRegistry) -> None:
+            saves.append(path)
+            real_save(path, registry)
+
+        monkeypatch.setattr(device_registry, "save_devices", counting_save)
+
+        removed = await remove_devices(devices_file, {ids[0], ids[2], "unknown-id"})
+
+        assert removed == 2
+        assert len(saves) == 1
+        data = json.loads(devices_file.read_text())
+        assert [d["installation_id"] for d in data["devices"]] == [ids[1]]
+
+    @pytest.mark.asyncio
+    async def test_remove_nothing_skips_write(self, tmp_path: Path):
+        """An empty id set does not touch the file."""
+        devices_file = tmp_path / "devices.json"
+
+        assert await remove_devices(devices_file, set()) == 0
+        assert not devices_file.exists()
+
+
 class TestGetDevice:
     """Test device retrieval."""
 
@@ -530,3 +575,99 @@ class TestListDevices:
         devices = await list_devices(devices_file)
 
         assert len(devices) == 0
+
+
+class TestSafeSnapshot:
+    """Test cached GET /devices bodies."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_redacts_push_url(self, tmp_path: Path):
+        """Serialized body omits push_url."""
+        devices_file = tmp_path / "devices.json"
+
+        await add_or_update_device(
+            devices_file=devices_file,
+            installation_id="550e8400-e29b-41d4-a716-446655440015",
+            device_name="iPhone 15",
+            device_type="iphone",
+            push_url="https://example.com/push/secret",
+        )
+
+        body = await get_safe_snapshot(devices_file)
+        data = json.loads(body)
+
+        assert data["total"] == 1
+        assert "push_url" not in data["devices"][0]
+        assert b"secret" not in body
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_until_registry_changes(self, tmp_path: Path):
+        """Repeat lookups return the cached body; writes invalidate it."""
+        devices_file = tmp_path / "devices.json"
+
+        await add_or_update_device(
+            devices_file=devices_file,
+            installation_id="550e8400-e29b-41d4-a716-446655440016",
+            device_name="iPhone 15",
+            device_type="iphone",
+            push_url="https://example.com/push/1",
+        )
+
+        first = await get_safe_snapshot(devices_file)
+        assert await get_safe_snapshot(devices_file) is first
+
+        await remove_device(devices_file, "550e8400-e29b-41d4-a716-446655440016")
+
+        assert json.loads(await get_safe_snapshot(devices_file))["total"] == 0
+
+
+class TestDevicesCache:
+    """Test reuse of the parsed devices file."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_is_not_reparsed(self, tmp_path: Path, monkeypatch):
+        """Repeat lookups reuse the parsed registry while the file is unchanged."""
+        devices_file = tmp_path / "devices.json"
+        await add_or_update_device(
+            devices_file=devices_file,
+            installation_id="550e8400-e29b-41d4-a716-446655440017",
+            device_name="iPhone 15",
+            device_type="iphone",
+            push_url="https://example.com/push/1",
+        )
+
+        loads = []
+        real_load = device_registry.load_devices
+
+        def counting_load(path: Path) -> DeviceRegistry:
+            loads.append(path)
+            return real_load(path)
+
+        monkeypatch.setattr(device_registry, "load_devices", counting_load)
+
+        await list_devices(devices_file)
+        await list_devices(devices_file, device_filter="iphone")
+        await get_device(devices_file, "550e8400-e29b-41d4-a716-446655440017")
+
+        assert len(loads) == 1
+
+    @pytest.mark.asyncio
+    async def test_outside_edit_is_picked_up(self, tmp_path: Path):
+        """A file rewritten behind the registry's back is reloaded."""
+        devices_file = tmp_path / "devices.json"
+        devices_file.write_text(json.dumps({"devices": []}))
+
+        assert await list_devices(devices_file) == []
+
+        device = Device(
+            installation_id="550e8400-e29b-41d4-a716-446655440018",
+            device_name="iPad",
+            device_type="ipad",
+            push_url="https://example.com/push/2",
+            registered_at="2025-01-01T00:00:00+00:00",
+            last_seen="2025-01-01T00:00:00+00:00",
+        )
+        devices_file.write_text(json.dumps({"devices": [device.model_dump()]}))
+
+        devices = await list_devices(devices_file)
+        assert [d.installation_id for d in devices] == [device.installation_id]
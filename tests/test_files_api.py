@@ -0,0 +1,198 @@
+"""API tests for the file content preview endpoint."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api import files
+from app.dependencies import get_vault_browser_service, get_vault_service
+from app.services.vault import VaultService
+from app.services.vault_browser import VaultBrowserService
+
+
+@pytest.fixture
+def files_client(temp_vault: Path):
+    """Create a TestClient with the files router bound to a temp vault."""
+    app = FastAPI()
+    app.include_router(files.router)
+    vault_service = VaultService(str(temp_vault))
+    vault_browser = VaultBrowserService(vault_service=vault_service)
+    app.dependency_overrides[get_vault_service] = lambda: vault_service
+    app.dependency_overrides[get_vault_browser_service] = lambda: vault_browser
+
+    with TestClient(app) as client:
+        yield client
+
+
+def _get_content(client: TestClient, headers: dict[str, str], **params: object) -> dict:
+    response = client.get("/api/v1/files/content", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_get_file_content_paginates_lines(
+    files_client: TestClient, temp_vault: Path, auth_headers: dict[str, str]
+) -> None:
+    """Offset and line limit select a window; the total counts every line."""
+    (temp_vault / "note.md").write_text("one\ntwo\r\nthree\nfour")
+
+    data = _get_content(files_client, auth_headers, path="note.md")
+    assert data["content"] == "one\ntwo\r\nthree\nfour"
+    assert data["lines"] == 4
+    assert data["language"] == "markdown"
+
+    data = _get_content(files_client, auth_headers, path="note.md", offset=1, lines=2)
+    assert data["content"] == "two\r\nthree\n"
+    assert data["lines"] == 4
+
+    data = _get_content(files_client, auth_headers, path="note.md", offset=3, lines=5)
+    assert data["content"] == "four"
+
+    data = _get_content(files_client, auth_headers, path="note.md", offset=10)
+    assert data["content"] == ""
+    assert data["lines"] == 4
+
+
+def test_get_file_content_empty_file(
+    files_client: TestClient, temp_vault: Path, auth_headers: dict[str, str]
+) -> None:
+    """Empty files have no lines."""
+    (temp_vault / "empty.txt").write_text("")
+
+    data = _get_content(files_client, auth_headers, path="empty.txt")
+    assert data["content"] == ""
+    assert data["lines"] == 0
+
+
+def test_get_file_content_rejects_non_utf8(
+    files_client: TestClient, temp_vault: Path, auth_headers: dict[str, str]
+) -> None:
+    """Undecodable content in the window is rejected."""
+    (temp_vault / "latin1.txt").write_bytes("caf\xe9\n".encode("latin-1"))
+
+    response = files_client.get(
+        "/api/v1/files/content", params={"path": "latin1.txt"}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_get_file_content_rejects_traversal(
+    files_client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Paths escaping the vault are refused."""
+    response = files_client.get(
+        "/api/v1/files/content", params={"path": "../secret.txt"}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_get_file_content_rejects_symlink_escape(
+    files_client: TestClient, temp_vault: Path, tmp_path: Path, auth_headers: dict[str, str]
+) -> None:
+    """Symlinks resolving outside the vault are refused."""
+    outside = tmp_path / "outside.txt"
+    outside.write_text("secret")
+    (temp_vault / "link.txt").symlink_to(outside)
+
+    response = files_client.get(
+        "/api/v1/files/content", params={"path": "link.txt"}, headers=auth_headers
+    )
+    assert response.status_code == 403
+
+
+def test_get_file_content_binary_detection(
+    files_client: TestClient, temp_vault: Path, auth_headers: dict[str, str]
+) -> None:
+    """Binary is detected by extension or NUL bytes; JSON previews are allowed."""
+    (temp_vault / "data.json").write_text('{"a": 1}\n')
+    (temp_vault / "blob.dat").write_bytes(b"abc\x00def")
+    (temp_vault / "image.png").write_bytes(b"not really a png")
+
+    data = _get_content(files_client, auth_headers, path="data.json")
+    assert data["language"] == "json"
+
+    for name in ("blob.dat", "image.png"):
+        response = files_client.get(
+            "/api/v1/files/content", params={"path": name}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Binary file preview not supported"
+
+    # A validator for the binary file must not turn the rejection into a 304
+    st = (temp_vault / "blob.dat").stat()
+    vault_browser = VaultBrowserService(vault_service=VaultService(str(temp_vault)))
+    etag = vault_browser.generate_file_etag(st.st_size, st.st_mtime_ns)
+    response = files_client.get(
+        "/api/v1/files/content",
+        params={"path": "blob.dat"},
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", ["..", "notes/../../etc/passwd", "notes/.."])
+def test_validate_safe_path_rejects_dotdot_components(temp_vault: Path, path: str) -> None:
+    """Any '..' component is rejected before resolving."""
+    with pytest.raises(HTTPException) as exc_info:
+        files.validate_safe_path(path, temp_vault.resolve())
+    assert exc_info.value.status_code == 400
+
+
+def test_validate_safe_path_allows_dots_in_names(temp_vault: Path) -> None:
+    """Names merely containing dots are not traversal."""
+    resolved = files.validate_safe_path("notes/..draft/v1..md", temp_vault.resolve())
+    assert resolved == temp_vault.resolve() / "notes" / "..draft" / "v1..md"
+
+
+def test_get_file_content_missing_and_directory(
+    files_client: TestClient, temp_vault: Path, auth_headers: dict[str, str]
+) -> None:
+    """Missing files are 404 and directories are 400."""
+    (temp_vault / "notes").mkdir()
+
+    missing = files_client.get(
+        "/api/v1/files/content", params={"path": "nope.md"}, headers=auth_headers
+    )
+    assert missing.status_code == 404
+
+    directory = files_client.get(
+        "/api/v1/files/content", params={"path": "notes"}, headers=auth_headers
+    )
+    assert directory.status_code == 400
+
+
+def test_get_file_content_conditional_requests(
+    files_client: TestClient, temp_vault: Path, auth_headers: dict[str, str]
+) -> None:
+    """Unchanged files answer 304 to a matching If-None-Match."""
+    note = temp_vault / "note.md"
+    note.write_text("first\n")
+
+    first = files_client.get(
+        "/api/v1/files/content", params={"path": "note.md"}, headers=auth_headers
+    )
+    etag = first.headers["etag"]
+    assert etag.startswith('"')
+
+    cached = files_client.get(
+        "/api/v1/files/content",
+        params={"path": "note.md"},
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    note.write_text("second version\n")
+    changed = files_client.get(
+        "/api/v1/files/content",
+        params={"path": "note.md"},
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.json()["content"] == "second version\n"
+    assert changed.headers["etag"] != etag
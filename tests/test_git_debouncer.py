@@ -0,0 +1,108 @@
+"""Tests for coalesced git auto-commits."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.git_debouncer import GitCommitDebouncer
+
+
+def _git_service(enabled: bool = True) -> MagicMock:
+    git_service = MagicMock()
+    git_service.enabled = enabled
+    git_service.auto_commit_and_push = MagicMock(return_value=True)
+    return git_service
+
+
+@pytest.mark.asyncio
+async def test_burst_of_marks_runs_single_commit() -> None:
+    """Marks within one window collapse into one auto-commit."""
+    git_service = _git_service()
+    debouncer = GitCommitDebouncer(git_service, delay_seconds=0.05)
+
+    for _ in range(10):
+        debouncer.mark_dirty()
+
+    await asyncio.sleep(0.2)
+
+    git_service.auto_commit_and_push.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_mark_after_window_schedules_new_commit() -> None:
+    """A mark after the window fired schedules a second commit."""
+    git_service = _git_service()
+    debouncer = GitCommitDebouncer(git_service, delay_seconds=0.01)
+
+    debouncer.mark_dirty()
+    await asyncio.sleep(0.1)
+    debouncer.mark_dirty()
+    await asyncio.sleep(0.1)
+
+    assert git_service.auto_commit_and_push.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_mark_is_noop_when_git_disabled() -> None:
+    """Nothing is scheduled for local-only vaults."""
+    git_service = _git_service(enabled=False)
+    debouncer = GitCommitDebouncer(git_service, delay_seconds=0.01)
+
+    debouncer.mark_dirty()
+    await asyncio.sleep(0.05)
+
+    git_service.auto_commit_and_push.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_commit() -> None:
+    """Shutdown commits pending changes instead of waiting out the window."""
+    git_service = _git_service()
+    debouncer = GitCommitDebouncer(git_service, delay_seconds=60)
+
+    debouncer.mark_dirty()
+    await debouncer.stop()
+
+    git_service.auto_commit_and_push.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stop_without_pending_commit_is_noop() -> None:
+    """Shutdown with nothing pending does not commit."""
+    git_service = _git_service()
+    debouncer = GitCommitDebouncer(git_service, delay_seconds=60)
+
+    await debouncer.stop()
+
+    git_service.auto_commit_and_push.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_running_commit() -> None:
+    """Shutdown does not return while a fired commit is still running."""
+    git_service = _git_service()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_commit() -> bool:
+        started.set()
+        release.wait(timeout=5)
+        return True
+
+    git_service.auto_commit_and_push = MagicMock(side_effect=slow_commit)
+    debouncer = GitCommitDebouncer(git_service, delay_seconds=0.01)
+
+    debouncer.mark_dirty()
+    await asyncio.to_thread(started.wait, 5)
+
+    stop_task = asyncio.create_task(debouncer.stop())
+    await asyncio.sleep(0.05)
+    assert not stop_task.done()
+
+    release.set()
+    await asyncio.wait_for(stop_task, timeout=5)
+    git_service.auto_commit_and_push.assert_called_once()
@@ -0,0 +1,45 @@
+"""Tests for GitService status caching."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import git
+
+from app.services.git import GitService
+
+
+def _git_service(vault: Path) -> GitService:
+    repo = git.Repo.init(vault)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    service = GitService(vault_path=str(vault), enabled=True)
+    service._repo = repo
+    return service
+
+
+def test_changed_files_cached_reuses_recent_scan(tmp_path: Path) -> None:
+    """Polls inside the window share one scan; a commit drops the cache."""
+    service = _git_service(tmp_path)
+    (tmp_path / "note.md").write_text("hello")
+
+    with patch.object(service, "get_changed_files", wraps=service.get_changed_files) as scan:
+        assert service.get_changed_files_cached(max_age_seconds=60) == ["note.md"]
+        assert service.get_changed_files_cached(max_age_seconds=60) == ["note.md"]
+        assert scan.call_count == 1
+
+        service.commit("Add note", ["note.md"])
+        assert service.get_changed_files_cached(max_age_seconds=60) == []
+        assert scan.call_count == 2
+
+
+def test_changed_files_cached_expires(tmp_path: Path) -> None:
+    """A zero max age always rescans."""
+    service = _git_service(tmp_path)
+
+    with patch.object(service, "get_changed_files", wraps=service.get_changed_files) as scan:
+        service.get_changed_files_cached(max_age_seconds=0)
+        service.get_changed_files_cached(max_age_seconds=0)
+        assert scan.call_count == 2
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from app.models.health import HealthCheckResponse, HealthStatus, ServiceHealth
@@ -151,6 +153,48 @@ async def test_overall_health_check_unhealthy(temp_vault, mock_git_service) -> N
     assert health.is_ready() is False
 
 
+@pytest.mark.asyncio
+async def test_check_health_reuses_result_within_ttl(temp_vault, mock_git_service) -> None:
+    """Repeat and concurrent checks within the TTL run the probes once."""
+    mock_git_service.enabled = True
+    mock_git_service.get_changed_files.return_value = []
+
+    vault_service = VaultService(str(temp_vault))
+    health_service = HealthCheckService(
+        vault_service=vault_service,
+        git_service=mock_git_service,
+        cache_ttl_seconds=60,
+    )
+
+    results = await asyncio.gather(*(health_service.check_health() for _ in range(5)))
+
+    assert all(r is results[0] for r in results)
+    assert mock_git_service.get_changed_files.call_count == 1
+
+    await health_service.check_health(fresh=True)
+    assert mock_git_service.get_changed_files.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_check_health_does_not_cache_unhealthy(temp_vault, mock_git_service) -> None:
+    """An unhealthy result is rechecked on the next call."""
+    mock_git_service.enabled = False
+    missing_vault = temp_vault / "later"
+
+    vault_service = VaultService(str(missing_vault))
+    health_service = HealthCheckService(
+        vault_service=vault_service,
+        git_service=mock_git_service,
+        cache_ttl_seconds=60,
+    )
+
+    assert (await health_service.check_health()).status == HealthStatus.UNHEALTHY
+
+    missing_vault.mkdir()
+
+    assert (await health_service.check_health()).status == HealthStatus.HEALTHY
+
+
 def test_health_endpoint_simple(client) -> None:
     """Test simple /health endpoint (no auth required)."""
     response = client.get("/health")
@@ -106,3 +106,23 @@ def test_write_capture_overwrites_existing(temp_vault):
     service.write_capture(file_path, "New content\n")
 
     assert file_path.read_text() == "New content\n"
+
+
+def test_write_capture_parts_matches_formatted_file(temp_vault):
+    """Writing capture parts produces the same file as format_capture_file."""
+    service = InboxService()
+    request = CaptureRequest(
+        text="Large thought\nwith lines",
+        source=Source.MAC,
+        input=InputType.TEXT,
+        captured_at=datetime(2025, 12, 21, 14, 30, 0),
+        context=CaptureContext(app=AppContext.CLI),
+    )
+    dump_id = "2025-12-21T14:30:00Z-mac"
+    file_path = temp_vault / "Inbox" / "parts.md"
+
+    parts = service.format_capture_parts(request, dump_id)
+    service.write_capture_parts(file_path, parts)
+
+    assert parts[1] is request.text
+    assert file_path.read_text() == service.format_capture_file(request, dump_id)
@@ -23,7 +23,7 @@ def temp_devices_file():
 def mock_relay_client():
     """Mock PrimePushRelayClient."""
     mock = AsyncMock()
-    mock.send_push = AsyncMock(return_value=True)
+    mock.send_encoded_push = AsyncMock(return_value=True)
     return mock
 
 
@@ -295,12 +295,13 @@ class TestSendNotificationEndpoint:
         assert data["devices"][0]["status"] == "sent"
 
         # Verify relay client was called
-        mock_relay_client.send_push.assert_called_once_with(
-            push_url=valid_register_request["push_url"],
-            title="Test Notification",
-            body="This is a test",
-            data={"key": "value"},
-        )
+        call_kwargs = mock_relay_client.send_encoded_push.call_args.kwargs
+        assert call_kwargs["push_url"] == valid_register_request["push_url"]
+        assert json.loads(call_kwargs["payload"]) == {
+            "title": "Test Notification",
+            "body": "This is a test",
+            "data": {"key": "value"},
+        }
 
     def test_send_to_multiple_devices(
         self,
@@ -347,7 +348,7 @@ class TestSendNotificationEndpoint:
         assert data["failed"] == 0
 
         # Verify relay client was called twice
-        assert mock_relay_client.send_push.call_count == 2
+        assert mock_relay_client.send_encoded_push.call_count == 2
 
     def test_send_with_device_filter(
         self,
@@ -393,7 +394,7 @@ class TestSendNotificationEndpoint:
         assert data["sent"] == 1  # Only iPhone device
 
         # Verify relay client was called once
-        assert mock_relay_client.send_push.call_count == 1
+        assert mock_relay_client.send_encoded_push.call_count == 1
 
     def test_send_handles_410_gone(
         self,
@@ -414,7 +415,7 @@ class TestSendNotificationEndpoint:
         # Mock 410 Gone response
         mock_response = MagicMock()
         mock_response.status_code = 410
-        mock_relay_client.send_push.side_effect = httpx.HTTPStatusError(
+        mock_relay_client.send_encoded_push.side_effect = httpx.HTTPStatusError(
             "Gone", request=MagicMock(), response=mock_response
         )
 
@@ -462,7 +463,7 @@ class TestSendNotificationEndpoint:
         # Mock 500 error
         mock_response = MagicMock()
         mock_response.status_code = 500
-        mock_relay_client.send_push.side_effect = httpx.HTTPStatusError(
+        mock_relay_client.send_encoded_push.side_effect = httpx.HTTPStatusError(
             "Internal Server Error", request=MagicMock(), response=mock_response
         )
 
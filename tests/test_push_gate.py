@@ -0,0 +1,67 @@
+"""Tests for push rate limiting and duplicate suppression."""
+
+from __future__ import annotations
+
+from app.services.push_gate import PushGate
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_duplicate_suppressed_within_window() -> None:
+    """The same content to the same device is held back until the window passes."""
+    clock = FakeClock()
+    gate = PushGate(dedup_window_seconds=10, clock=clock)
+    key = PushGate.content_key("Title", "Body", None)
+
+    assert gate.check("device-1", key) is None
+    assert gate.check("device-1", key) == "Duplicate notification suppressed"
+    assert gate.check("device-2", key) is None
+
+    clock.now += 10
+    assert gate.check("device-1", key) is None
+
+
+def test_content_key_includes_data() -> None:
+    """Notifications differing only in data are not duplicates."""
+    gate = PushGate(clock=FakeClock())
+    first = PushGate.content_key("Done", "Ready", {"session_id": "a"})
+    second = PushGate.content_key("Done", "Ready", {"session_id": "b"})
+
+    assert first != second
+    assert gate.check("device-1", first) is None
+    assert gate.check("device-1", second) is None
+
+
+def test_rate_limit_uses_rolling_minute() -> None:
+    """At most max_per_minute sends per device in any 60 second window."""
+    clock = FakeClock()
+    gate = PushGate(max_per_minute=2, dedup_window_seconds=0, clock=clock)
+    key = PushGate.content_key("Title", "Body", None)
+
+    assert gate.check("device-1", key) is None
+    clock.now += 30
+    assert gate.check("device-1", key) is None
+    assert gate.check("device-1", key) == "Rate limit exceeded"
+
+    clock.now += 30
+    assert gate.check("device-1", key) is None
+
+
+def test_release_allows_immediate_retry() -> None:
+    """A released send frees both its dedup entry and its rate-limit slot."""
+    gate = PushGate(max_per_minute=1, dedup_window_seconds=10, clock=FakeClock())
+    key = PushGate.content_key("Title", "Body", None)
+
+    assert gate.check("device-1", key) is None
+    gate.release("device-1", key)
+
+    assert gate.check("device-1", key) is None
+    assert gate.check("device-1", key) == "Duplicate notification suppressed"
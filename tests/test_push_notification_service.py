@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -10,7 +11,9 @@ import httpx
 import pytest
 
 from app.services import device_registry
+from app.services.push_gate import PushGate
 from app.services.push_notifications import PushNotificationService
+from app.services.relay_client import encode_push_payload
 
 
 @pytest.fixture
@@ -24,7 +27,7 @@ def temp_devices_file() -> Path:
 def mock_relay_client() -> AsyncMock:
     """Mock PrimePushRelayClient."""
     mock = AsyncMock()
-    mock.send_push = AsyncMock(return_value=True)
+    mock.send_encoded_push = AsyncMock(return_value=True)
     return mock
 
 
@@ -60,11 +63,9 @@ async def test_send_notification_success(
     assert len(summary.device_results) == 1
     assert summary.device_results[0].status == "sent"
 
-    mock_relay_client.send_push.assert_awaited_once_with(
+    mock_relay_client.send_encoded_push.assert_awaited_once_with(
         push_url="https://relay.example.com/push/abc123/secret456",
-        title="Test Notification",
-        body="Body",
-        data={"key": "value"},
+        payload=encode_push_payload("Test Notification", "Body", {"key": "value"}),
     )
 
 
@@ -85,7 +86,7 @@ async def test_send_notification_handles_gone(
 
     mock_response = MagicMock()
     mock_response.status_code = 410
-    mock_relay_client.send_push.side_effect = httpx.HTTPStatusError(
+    mock_relay_client.send_encoded_push.side_effect = httpx.HTTPStatusError(
         "Gone",
         request=MagicMock(),
         response=mock_response,
@@ -131,4 +132,156 @@ async def test_send_notification_no_devices(
     assert summary.failed == 0
     assert summary.invalid_tokens_removed == 0
     assert summary.device_results == []
-    mock_relay_client.send_push.assert_not_called()
+    mock_relay_client.send_encoded_push.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_notification_sends_concurrently_within_limit(
+    temp_devices_file: Path,
+    mock_relay_client: AsyncMock,
+) -> None:
+    """Devices are sent to in parallel, capped by max_concurrent_sends."""
+    await device_registry.init_file_lock()
+    for i in range(6):
+        await device_registry.add_or_update_device(
+            devices_file=temp_devices_file,
+            installation_id=f"install-{i}",
+            device_name=f"phone-{i}",
+            device_type="iphone",
+            push_url=f"https://relay.example.com/push/id{i}/secret{i}",
+        )
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_send(**_: object) -> bool:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    mock_relay_client.send_encoded_push.side_effect = slow_send
+
+    service = PushNotificationService(
+        devices_file=temp_devices_file,
+        relay_client=mock_relay_client,
+        max_concurrent_sends=3,
+    )
+
+    summary = await service.send_notification(title="Test Notification", body="Body")
+
+    assert summary.sent == 6
+    assert [r.name for r in summary.device_results] == [f"phone-{i}" for i in range(6)]
+    assert peak == 3
+    # The request body is encoded once and shared by every send
+    payloads = {id(c.kwargs["payload"]) for c in mock_relay_client.send_encoded_push.call_args_list}
+    assert len(payloads) == 1
+
+
+@pytest.mark.asyncio
+async def test_send_notification_reports_suppressed_duplicates(
+    temp_devices_file: Path,
+    mock_relay_client: AsyncMock,
+) -> None:
+    """A repeated notification is suppressed by the gate without a relay call."""
+    await device_registry.init_file_lock()
+    await device_registry.add_or_update_device(
+        devices_file=temp_devices_file,
+        installation_id="install-123",
+        device_name="phone",
+        device_type="iphone",
+        push_url="https://relay.example.com/push/abc123/secret456",
+    )
+
+    service = PushNotificationService(
+        devices_file=temp_devices_file,
+        relay_client=mock_relay_client,
+        gate=PushGate(),
+    )
+
+    await service.send_notification(title="Test Notification", body="Body")
+    summary = await service.send_notification(title="Test Notification", body="Body")
+
+    assert summary.sent == 0
+    assert summary.failed == 0
+    assert summary.suppressed == 1
+    assert summary.device_results[0].status == "suppressed"
+    mock_relay_client.send_encoded_push.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_notification_removes_gone_devices_together(
+    temp_devices_file: Path,
+    mock_relay_client: AsyncMock,
+) -> None:
+    """Every 410 device is removed; live devices stay registered."""
+    await device_registry.init_file_lock()
+    for i in range(3):
+        await device_registry.add_or_update_device(
+            devices_file=temp_devices_file,
+            installation_id=f"install-{i}",
+            device_name=f"phone-{i}",
+            device_type="iphone",
+            push_url=f"https://relay.example.com/push/id{i}/secret{i}",
+        )
+
+    gone_response = MagicMock()
+    gone_response.status_code = 410
+
+    async def send(**kwargs: object) -> bool:
+        if kwargs["push_url"] == "https://relay.example.com/push/id1/secret1":
+            return True
+        raise httpx.HTTPStatusError("Gone", request=MagicMock(), response=gone_response)
+
+    mock_relay_client.send_encoded_push.side_effect = send
+
+    service = PushNotificationService(
+        devices_file=temp_devices_file,
+        relay_client=mock_relay_client,
+    )
+
+    summary = await service.send_notification(title="Test Notification", body="Body")
+
+    assert summary.sent == 1
+    assert summary.invalid_tokens_removed == 2
+    remaining_devices = await device_registry.list_devices(temp_devices_file)
+    assert [d.installation_id for d in remaining_devices] == ["install-1"]
+
+
+@pytest.mark.asyncio
+async def test_send_notification_retry_after_failure_is_not_suppressed(
+    temp_devices_file: Path,
+    mock_relay_client: AsyncMock,
+) -> None:
+    """A send that failed at the relay can be retried within the dedup window."""
+    await device_registry.init_file_lock()
+    await device_registry.add_or_update_device(
+        devices_file=temp_devices_file,
+        installation_id="install-123",
+        device_name="phone",
+        device_type="iphone",
+        push_url="https://relay.example.com/push/abc123/secret456",
+    )
+
+    error_response = MagicMock()
+    error_response.status_code = 503
+    mock_relay_client.send_encoded_push.side_effect = [
+        httpx.HTTPStatusError("Unavailable", request=MagicMock(), response=error_response),
+        True,
+    ]
+
+    service = PushNotificationService(
+        devices_file=temp_devices_file,
+        relay_client=mock_relay_client,
+        gate=PushGate(),
+    )
+
+    failed = await service.send_notification(title="Test Notification", body="Body")
+    retried = await service.send_notification(title="Test Notification", body="Body")
+
+    assert failed.failed == 1
+    assert retried.sent == 1
+    assert retried.suppressed == 0
+    assert mock_relay_client.send_encoded_push.await_count == 2
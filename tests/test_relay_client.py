@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -42,8 +43,8 @@ async def test_send_push_success():
         # Verify the call was made with correct arguments
         call_args = mock_client.post.call_args
         assert call_args[0][0] == "https://relay.example.com/push/abc123/secret456"
-        assert call_args[1]["json"]["title"] == "Test"
-        assert call_args[1]["json"]["body"] == "Test body"
+        payload = json.loads(call_args[1]["content"])
+        assert payload == {"title": "Test", "body": "Test body"}
 
 
 @pytest.mark.asyncio
@@ -77,7 +78,7 @@ async def test_send_push_with_data():
 
         # Verify custom data was included
         call_args = mock_client.post.call_args
-        assert call_args[1]["json"]["data"] == custom_data
+        assert json.loads(call_args[1]["content"])["data"] == custom_data
 
 
 @pytest.mark.asyncio
@@ -171,3 +172,32 @@ async def test_timeout_configuration():
 
         # Verify AsyncClient was called with correct timeout
         mock_client_class.assert_called_once_with(timeout=30)
+
+
+@pytest.mark.asyncio
+async def test_http_client_reused_across_sends():
+    """One HTTP client serves every send until the relay client is closed."""
+    client = PrimePushRelayClient(timeout_seconds=10)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = lambda: {"queued": True}
+        mock_response.raise_for_status = lambda: None
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        for _ in range(3):
+            await client.send_push(
+                push_url="https://relay.example.com/push/abc123/secret456",
+                title="Test",
+                body="Test body",
+            )
+
+        mock_client_class.assert_called_once()
+        assert mock_client.post.await_count == 3
+
+        await client.aclose()
+        mock_client.aclose.assert_awaited_once()
@@ -243,3 +243,44 @@ def test_structured_logging_special_characters(json_logger: logging.Logger) -> N
     assert "quotes" in log_data["message"]
     assert "backslash" in log_data["message"]
     assert "🚀" in log_data["unicode"]
+
+
+def test_configure_json_logging_uses_queue_handler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Root logger enqueues records; the listener thread writes them with request_id."""
+    from app import logging_config
+    from app.utils.request_context import clear_request_id, set_request_id
+
+    if json_formatter is None:
+        pytest.skip("json_formatter not installed")
+
+    log_stream = StringIO()
+    monkeypatch.setattr(logging_config.sys, "stdout", log_stream)
+
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+
+    try:
+        logging_config.configure_json_logging(log_level="INFO")
+
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], logging_config.InProcessQueueHandler)
+
+        set_request_id("req-queue-test")
+        try:
+            logging.getLogger("queue_test").info("Queued %s", "message", extra={"k": "v"})
+        finally:
+            clear_request_id()
+
+        logging_config.stop_logging_listener()
+    finally:
+        logging_config.stop_logging_listener()
+        root_logger.handlers[:] = saved_handlers
+        root_logger.setLevel(saved_level)
+
+    log_data = json.loads(log_stream.getvalue().strip())
+    assert log_data["message"] == "Queued message"
+    assert log_data["request_id"] == "req-queue-test"
+    assert log_data["k"] == "v"
@@ -1,4 +1,7 @@
 from datetime import datetime
+from pathlib import Path
+
+import pytest
 
 from app.services.vault import VaultService
 
@@ -63,3 +66,32 @@ def test_get_relative_path(temp_vault):
 
     relative = service.get_relative_path(absolute_path)
     assert relative == ".prime/inbox/brain-dump-2025-W51.md"
+
+
+def test_get_relative_path_strips_root_prefix(temp_vault):
+    """Relative path strips the vault root prefix."""
+    service = VaultService(str(temp_vault))
+
+    assert service.get_relative_path(temp_vault / "Inbox" / "a.md") == "Inbox/a.md"
+    assert service.get_relative_path(temp_vault) == "."
+
+
+def test_get_relative_path_outside_vault_raises(temp_vault):
+    """Paths outside the vault are rejected like Path.relative_to."""
+    service = VaultService(str(temp_vault))
+
+    with pytest.raises(ValueError):
+        service.get_relative_path(temp_vault.parent / "elsewhere.md")
+    with pytest.raises(ValueError):
+        service.get_relative_path(Path(str(temp_vault) + "-sibling") / "a.md")
+
+
+def test_resolved_vault_path_follows_symlink(temp_vault, tmp_path):
+    """Resolved vault path points at the real directory behind a symlink."""
+    link = tmp_path / "vault-link"
+    link.symlink_to(temp_vault, target_is_directory=True)
+
+    service = VaultService(str(link))
+
+    assert service.resolved_vault_path == temp_vault.resolve()
+    assert service.resolved_vault_path is service.resolved_vault_path